@@ -2,8 +2,10 @@
 """Enhanced CLI for LLM-RAG-SQL - Week 2."""
 import argparse
 import json
+from collections import deque
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
@@ -12,7 +14,8 @@ from src.agent import SQLAgent
 
 
 console = Console()
-HISTORY_FILE = Path(".query_history.json")
+HISTORY_FILE = Path(".query_history.jsonl")
+HISTORY_LIMIT = 50
 
 
 def main():
@@ -56,6 +59,7 @@ def main():
         show_examples()
         return
     
+    trim_history()
     agent = SQLAgent()
     
     if args.interactive:
@@ -88,49 +92,75 @@ def process_question(agent: SQLAgent, question: str) -> None:
         console.print(f"[bold red]Error:[/bold red] {result['error']}")
         console.print("[dim]💡 Tip: Try rephrasing your question[/dim]")
     elif result["results"]:
-        table = Table(show_header=True, header_style="bold magenta", border_style="dim")
-        
-        # Add columns with actual names from result
-        if result.get("columns"):
-            for col in result["columns"]:
-                table.add_column(col, overflow="fold")
-        else:
-            for i in range(len(result["results"][0])):
-                table.add_column(f"Col {i+1}")
+        table = make_result_table(result.get("columns"), len(result["results"][0]))
         
         # Add rows (limit to 20)
         for row in result["results"][:20]:
-            table.add_row(*[str(v) if v is not None else "[dim]null[/dim]" for v in row])
+            table.add_row(*map(format_cell, row))
         
+        row_count = f"{len(result['results'])}{'+' if result.get('truncated') else ''}"
         console.print(table)
-        console.print(f"\n[dim]📊 {len(result['results'])} row(s) returned[/dim]")
+        console.print(f"\n[dim]📊 {row_count} row(s) returned[/dim]")
         
         if len(result["results"]) > 20:
-            console.print(f"[dim]... showing first 20 of {len(result['results'])} rows[/dim]")
+            console.print(f"[dim]... showing first 20 of {row_count} rows[/dim]")
     else:
         console.print("[dim]✓ Query executed successfully (no results)[/dim]")
     
     console.print()
 
 
+def make_result_table(columns: Optional[list], width: int) -> Table:
+    """Create an empty results table with one column per result field."""
+    table = Table(show_header=True, header_style="bold magenta", border_style="dim")
+    
+    # Add columns with actual names from result
+    if columns:
+        for col in columns:
+            table.add_column(col, overflow="fold")
+    else:
+        for i in range(width):
+            table.add_column(f"Col {i+1}")
+    
+    return table
+
+
+def format_cell(value) -> str:
+    """Render a single result value for the table."""
+    return str(value) if value is not None else "[dim]null[/dim]"
+
+
 def save_to_history(question: str, result: dict) -> None:
-    """Save query to history file."""
+    """Append query to the JSON Lines history file."""
     try:
-        history = []
-        if HISTORY_FILE.exists():
-            history = json.loads(HISTORY_FILE.read_text())
-        
-        history.append({
+        entry = {
             "timestamp": datetime.now().isoformat(),
             "question": question,
             "sql": result["sql"],
             "success": result["error"] is None,
             "row_count": len(result["results"]) if result["results"] else 0
-        })
+        }
+        with HISTORY_FILE.open("a") as f:
+            f.write(json.dumps(entry) + "\n")
+    except Exception:
+        pass  # Silent fail for history
+
+
+def trim_history() -> None:
+    """Keep only the last HISTORY_LIMIT queries in the history file."""
+    try:
+        if not HISTORY_FILE.exists():
+            return
+        
+        line_count = 0
+        last = deque(maxlen=HISTORY_LIMIT)
+        with HISTORY_FILE.open() as f:
+            for line in f:
+                last.append(line)
+                line_count += 1
         
-        # Keep only last 50 queries
-        history = history[-50:]
-        HISTORY_FILE.write_text(json.dumps(history, indent=2))
+        if line_count > HISTORY_LIMIT:
+            HISTORY_FILE.write_text("".join(last))
     except Exception:
         pass  # Silent fail for history
 
@@ -141,7 +171,14 @@ def show_history() -> None:
         console.print("[dim]No query history yet[/dim]")
         return
     
-    history = json.loads(HISTORY_FILE.read_text())
+    # Only the tail is displayed, so keep just the last 10 raw lines
+    total = 0
+    last = deque(maxlen=10)
+    with HISTORY_FILE.open() as f:
+        for line in f:
+            if line.strip():
+                last.append(line)
+                total += 1
     
     table = Table(title="Query History", show_header=True, header_style="bold cyan")
     table.add_column("#", style="dim", width=4)
@@ -150,19 +187,21 @@ def show_history() -> None:
     table.add_column("Status", justify="center")
     table.add_column("Rows", justify="right")
     
-    for i, entry in enumerate(reversed(history[-10:]), 1):
+    for i, line in enumerate(reversed(last), 1):
+        entry = json.loads(line)
         time = datetime.fromisoformat(entry["timestamp"]).strftime("%m/%d %H:%M")
         status = "[green]✓[/green]" if entry["success"] else "[red]✗[/red]"
+        question = entry["question"]
         table.add_row(
             str(i),
             time,
-            entry["question"][:50] + "..." if len(entry["question"]) > 50 else entry["question"],
+            question[:50] + "..." if len(question) > 50 else question,
             status,
             str(entry["row_count"])
         )
     
     console.print(table)
-    console.print(f"\n[dim]Showing last {min(10, len(history))} of {len(history)} queries[/dim]")
+    console.print(f"\n[dim]Showing last {len(last)} of {total} queries[/dim]")
 
 
 def show_examples() -> None:
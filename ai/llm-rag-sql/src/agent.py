@@ -1,4 +1,6 @@
 """SQL Agent using LangChain and OpenAI."""
+import hashlib
+
 from langchain_openai import ChatOpenAI
 from langchain.prompts import ChatPromptTemplate
 from src.config import Config
@@ -17,11 +19,31 @@ class SQLAgent:
         )
         self.db = Database()
         self.vectorstore = VectorStore()
+        self._chain = self._build_chain()
         self._index_schema()
     
+    def _build_chain(self):
+        """Build the SQL generation chain once for reuse across questions."""
+        prompt = ChatPromptTemplate.from_messages([
+            ("system", """You are a SQL expert. Given a database schema and a question, 
+generate a valid PostgreSQL query. Return ONLY the SQL query, nothing else.
+
+Important rules:
+- Use proper JOINs when needed
+- Always use table aliases for clarity
+- Include LIMIT clause for large result sets
+- Use aggregate functions correctly with GROUP BY
+
+Schema:
+{schema}"""),
+            ("user", "{question}")
+        ])
+        return prompt | self.llm
+    
     def _index_schema(self) -> None:
-        """Index database schema in vector store."""
+        """Index database schema in vector store, skipping it if unchanged."""
         schema = self.db.get_schema_info()
+        schema_hash = hashlib.sha256(schema.encode()).hexdigest()
         
         # Split schema by tables for better retrieval
         tables = schema.split("\nTable: ")
@@ -33,59 +55,36 @@ class SQLAgent:
                 docs.append(f"Table: {table}")
                 ids.append(f"table_{i}")
         
-        if docs:
-            self.vectorstore.clear()
-            self.vectorstore.add_documents(docs, ids)
+        # Embedding is a paid network call, so only re-index when the schema changed
+        if docs and not self.vectorstore.is_indexed(ids, schema_hash):
+            self.vectorstore.upsert(docs, ids, schema_hash)
     
-    def ask(self, question: str) -> dict:
-        """Process a natural language question and return SQL + results."""
+    def ask(self, question: str, max_rows: int = 1000) -> dict:
+        """Process a natural language question and return SQL + results.
+        
+        At most max_rows rows are returned; "truncated" is set when the
+        query produced more.
+        """
         # Get relevant schema context
         context = self.vectorstore.search(question)
         schema_context = "\n".join(context)
         
         # Generate SQL
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", """You are a SQL expert. Given a database schema and a question, 
-generate a valid PostgreSQL query. Return ONLY the SQL query, nothing else.
-
-Important rules:
-- Use proper JOINs when needed
-- Always use table aliases for clarity
-- Include LIMIT clause for large result sets
-- Use aggregate functions correctly with GROUP BY
-
-Schema:
-{schema}"""),
-            ("user", "{question}")
-        ])
-        
-        chain = prompt | self.llm
-        response = chain.invoke({"schema": schema_context, "question": question})
+        response = self._chain.invoke({"schema": schema_context, "question": question})
         sql = response.content.strip().replace("```sql", "").replace("```", "").strip()
         
         # Execute SQL with error handling
         try:
-            results = self.db.execute(sql)
-            
-            # Extract column names
-            columns = None
-            if results and hasattr(results, 'keys'):
-                columns = list(results.keys())
-            elif results:
-                # Try to get from cursor description
-                try:
-                    columns = [desc[0] for desc in results.cursor.description]
-                except:
-                    pass
-            
-            # Convert to list of tuples
-            result_list = [tuple(row) for row in results]
+            # Fetch one extra row to detect truncation
+            columns, rows = self.db.execute_limited(sql, max_rows + 1)
+            truncated = len(rows) > max_rows
             
             return {
                 "question": question,
                 "sql": sql,
-                "results": result_list,
+                "results": rows[:max_rows],
                 "columns": columns,
+                "truncated": truncated,
                 "error": None
             }
         except Exception as e:
@@ -104,5 +103,6 @@ Schema:
                 "sql": sql,
                 "results": None,
                 "columns": None,
+                "truncated": False,
                 "error": error_msg
             }
@@ -10,6 +10,7 @@ class Config:
     
     # OpenAI
     OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+    EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
     
     # PostgreSQL
     POSTGRES_HOST = os.getenv("POSTGRES_HOST", "localhost")
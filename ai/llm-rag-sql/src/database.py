@@ -1,5 +1,7 @@
 """Database connection and schema extraction."""
-from sqlalchemy import create_engine, text
+from typing import Iterator
+
+from sqlalchemy import Row, create_engine, text
 from src.config import Config
 
 
@@ -7,16 +9,33 @@ class Database:
     """Database connection handler."""
     
     def __init__(self):
-        self.engine = create_engine(Config.get_postgres_uri())
+        self.engine = create_engine(
+            Config.get_postgres_uri(),
+            pool_size=5,
+            pool_pre_ping=True
+        )
+        self._schema_info = None
     
-    def execute(self, query: str) -> list:
-        """Execute a SQL query and return results."""
+    def execute_limited(self, query: str, max_rows: int) -> tuple[list[str], list]:
+        """Execute a SQL query and return its column names and at most max_rows rows."""
         with self.engine.connect() as conn:
             result = conn.execute(text(query))
-            return result.fetchall()
+            return list(result.keys()), result.fetchmany(max_rows)
+    
+    def execute_stream(self, query: str) -> Iterator[Row]:
+        """Execute a SQL query and yield rows as they are fetched."""
+        with self.engine.connect() as conn:
+            result = conn.execution_options(stream_results=True).execute(text(query))
+            yield from result
     
-    def get_schema_info(self) -> str:
-        """Extract database schema information for LLM context."""
+    def get_schema_info(self, refresh: bool = False) -> str:
+        """Extract database schema information for LLM context.
+        
+        The result is cached on the instance; pass refresh=True to re-read it.
+        """
+        if self._schema_info is not None and not refresh:
+            return self._schema_info
+        
         query = """
         SELECT 
             table_name,
@@ -27,16 +46,17 @@ class Database:
         WHERE table_schema = 'public'
         ORDER BY table_name, ordinal_position;
         """
-        rows = self.execute(query)
+        rows = self.execute_stream(query)
         
-        schema_text = "Database Schema:\n\n"
+        parts = ["Database Schema:\n\n"]
         current_table = None
         
         for row in rows:
             table, column, dtype, nullable = row
             if table != current_table:
-                schema_text += f"\nTable: {table}\n"
+                parts.append(f"\nTable: {table}\n")
                 current_table = table
-            schema_text += f"  - {column}: {dtype} {'(nullable)' if nullable == 'YES' else ''}\n"
+            parts.append(f"  - {column}: {dtype} {'(nullable)' if nullable == 'YES' else ''}\n")
         
-        return schema_text
+        self._schema_info = "".join(parts)
+        return self._schema_info
@@ -1,5 +1,8 @@
 """Vector store for schema embeddings."""
+from typing import Optional
+
 import chromadb
+from chromadb.utils.embedding_functions import OpenAIEmbeddingFunction
 from src.config import Config
 
 
@@ -11,16 +14,37 @@ class VectorStore:
             host=Config.CHROMA_HOST,
             port=int(Config.CHROMA_PORT)
         )
+        # Chroma embeds every document passed to one add/upsert in a single
+        # OpenAI request, so indexing the schema costs one round trip
+        self.embedding_function = OpenAIEmbeddingFunction(
+            api_key=Config.OPENAI_API_KEY,
+            model_name=Config.EMBEDDING_MODEL
+        )
+        # Vectors from different models can't share an index, so each
+        # model gets its own collection
         self.collection = self.client.get_or_create_collection(
-            name="schema_docs",
+            name=f"schema_docs_{Config.EMBEDDING_MODEL}",
+            embedding_function=self.embedding_function,
             metadata={"hnsw:space": "cosine"}
         )
     
-    def add_documents(self, documents: list[str], ids: list[str]) -> None:
-        """Add documents to the vector store."""
-        self.collection.add(
+    def upsert(self, documents: list[str], ids: list[str], schema_hash: Optional[str] = None) -> None:
+        """Insert or replace documents, removing any other documents."""
+        stale = set(self.collection.get(include=[])["ids"]) - set(ids)
+        if stale:
+            self.collection.delete(ids=list(stale))
+        self.collection.upsert(
             documents=documents,
-            ids=ids
+            ids=ids,
+            metadatas=[{"schema_hash": schema_hash}] * len(ids) if schema_hash else None
+        )
+    
+    def is_indexed(self, ids: list[str], schema_hash: str) -> bool:
+        """Check whether exactly these documents are stored for this schema hash."""
+        existing = self.collection.get(include=["metadatas"])
+        return (
+            sorted(existing["ids"]) == sorted(ids)
+            and all(m and m.get("schema_hash") == schema_hash for m in existing["metadatas"])
         )
     
     def search(self, query: str, n_results: int = 3) -> list[str]:
@@ -30,11 +54,3 @@ class VectorStore:
             n_results=n_results
         )
         return results["documents"][0] if results["documents"] else []
-    
-    def clear(self) -> None:
-        """Clear all documents from the collection."""
-        self.client.delete_collection("schema_docs")
-        self.collection = self.client.get_or_create_collection(
-            name="schema_docs",
-            metadata={"hnsw:space": "cosine"}
-        )
@@ -4,16 +4,32 @@ Apache Pinot PoC - Batch Data Generator
 Generates historical event data for batch ingestion testing
 """
 
-import json
-import random
-import time
+import gzip
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
+import numpy as np
+
+try:
+    import orjson
+
+    def dumps_line(event):
+        return orjson.dumps(event, option=orjson.OPT_APPEND_NEWLINE)
+except ImportError:
+    import json
+
+    def dumps_line(event):
+        return (json.dumps(event) + '\n').encode('utf-8')
+
 # Configuration
 OUTPUT_DIR = Path('batch-ingestion/data')
 DAYS_OF_HISTORY = 30
 EVENTS_PER_DAY = 10000
+# Pinot's JSON record reader detects gzip input, so day files are written compressed
+COMPRESS_LEVEL = 3
+MS_PER_DAY = 86400000
 
 # Data generators
 EVENT_TYPES = ['page_view', 'product_view', 'add_to_cart', 'purchase', 'search', 'login', 'logout']
@@ -32,39 +48,83 @@ CITIES = {
 }
 DEVICE_TYPES = ['desktop', 'mobile', 'tablet']
 
-def generate_event(base_timestamp):
-    """Generate a single event record"""
-    country = random.choice(COUNTRIES)
-    event_type = random.choice(EVENT_TYPES)
+# Every country has the same number of cities, so they pack into a
+# (country, city) grid indexed by the same integers drawn for COUNTRIES
+CITIES_ARR = np.array([CITIES[country] for country in COUNTRIES], dtype=object)
+
+# Lookup arrays: indexing with a drawn integer array yields the id column directly
+USER_IDS = np.array([f'user_{i}' for i in range(10001)], dtype=object)
+PRODUCT_IDS = np.array([f'prod_{i}' for i in range(1001)], dtype=object)
+
+def generate_events(rng, day_timestamp, count):
+    """Generate a day's worth of event records from vectorized random draws"""
+    event_times = day_timestamp + rng.integers(0, MS_PER_DAY, count, endpoint=True)
+    event_suffixes = rng.integers(1000, 9999, count, endpoint=True)
+    user_ids = USER_IDS[rng.integers(1, 10000, count, endpoint=True)]
+    product_ids = PRODUCT_IDS[rng.integers(1, 1000, count, endpoint=True)]
+    session_ids = rng.integers(100000, 999999, count, endpoint=True)
+    event_type_idx = rng.integers(0, len(EVENT_TYPES), count)
+    category_idx = rng.integers(0, len(CATEGORIES), count)
+    platform_idx = rng.integers(0, len(PLATFORMS), count)
+    country_idx = rng.integers(0, len(COUNTRIES), count)
+    cities = CITIES_ARR[country_idx, rng.integers(0, CITIES_ARR.shape[1], count)]
+    device_idx = rng.integers(0, len(DEVICE_TYPES), count)
+    
+    # Metrics depend on event type: purchases carry amount/quantity, views a
+    # longer duration, everything else a short one
+    is_purchase = event_type_idx == EVENT_TYPES.index('purchase')
+    is_product_view = event_type_idx == EVENT_TYPES.index('product_view')
+    amounts = np.where(is_purchase, np.round(rng.uniform(10.0, 500.0, count), 2), 0.0)
+    quantities = np.where(is_purchase, rng.integers(1, 5, count, endpoint=True), 0)
+    durations = np.select(
+        [is_purchase, is_product_view],
+        [0, rng.integers(5, 300, count, endpoint=True)],
+        rng.integers(1, 60, count, endpoint=True)
+    )
+    
+    # tolist() hands back plain Python scalars the JSON encoders can serialize
+    columns = zip(
+        event_times.tolist(), event_suffixes.tolist(), user_ids.tolist(),
+        product_ids.tolist(), session_ids.tolist(), event_type_idx.tolist(),
+        category_idx.tolist(), platform_idx.tolist(), country_idx.tolist(),
+        cities.tolist(), device_idx.tolist(), amounts.tolist(),
+        quantities.tolist(), durations.tolist()
+    )
+    
+    events = []
+    for (event_time, suffix, user_id, product_id, session_id, event_type_i, category_i,
+         platform_i, country_i, city, device_i, amount, quantity, duration) in columns:
+        events.append({
+            'event_id': f'evt_{event_time}_{suffix}',
+            'user_id': user_id,
+            'event_type': EVENT_TYPES[event_type_i],
+            'product_id': product_id,
+            'category': CATEGORIES[category_i],
+            'platform': PLATFORMS[platform_i],
+            'country': COUNTRIES[country_i],
+            'city': city,
+            'device_type': DEVICE_TYPES[device_i],
+            'session_id': f'sess_{session_id}',
+            'event_time': event_time,
+            'amount': amount,
+            'quantity': quantity,
+            'duration_seconds': duration
+        })
+    
+    return events
+
+def generate_day(day_str, day_timestamp, seed):
+    """Generate and write the event file for a single day"""
+    rng = np.random.default_rng(seed)
+    output_file = OUTPUT_DIR / f'events_{day_str}.json.gz'
     
-    event = {
-        'event_id': f'evt_{base_timestamp}_{random.randint(1000, 9999)}',
-        'user_id': f'user_{random.randint(1, 10000)}',
-        'event_type': event_type,
-        'product_id': f'prod_{random.randint(1, 1000)}',
-        'category': random.choice(CATEGORIES),
-        'platform': random.choice(PLATFORMS),
-        'country': country,
-        'city': random.choice(CITIES[country]),
-        'device_type': random.choice(DEVICE_TYPES),
-        'session_id': f'sess_{random.randint(100000, 999999)}',
-        'event_time': base_timestamp
-    }
+    lines = [dumps_line(event) for event in generate_events(rng, day_timestamp, EVENTS_PER_DAY)]
     
-    if event_type == 'purchase':
-        event['amount'] = round(random.uniform(10.0, 500.0), 2)
-        event['quantity'] = random.randint(1, 5)
-        event['duration_seconds'] = 0
-    elif event_type == 'product_view':
-        event['amount'] = 0.0
-        event['quantity'] = 0
-        event['duration_seconds'] = random.randint(5, 300)
-    else:
-        event['amount'] = 0.0
-        event['quantity'] = 0
-        event['duration_seconds'] = random.randint(1, 60)
+    # One write per day file instead of one per event
+    with gzip.open(output_file, 'wb', compresslevel=COMPRESS_LEVEL) as f:
+        f.write(b''.join(lines))
     
-    return event
+    return day_str, EVENTS_PER_DAY
 
 def generate_batch_data():
     """Generate historical batch data"""
@@ -76,22 +136,24 @@ def generate_batch_data():
     end_date = datetime.now()
     start_date = end_date - timedelta(days=DAYS_OF_HISTORY)
     
+    start_timestamp = int(start_date.timestamp() * 1000)
+    day_strs = [
+        (start_date + timedelta(days=day_offset)).strftime('%Y%m%d')
+        for day_offset in range(DAYS_OF_HISTORY)
+    ]
+    day_timestamps = [
+        start_timestamp + day_offset * MS_PER_DAY
+        for day_offset in range(DAYS_OF_HISTORY)
+    ]
+    # Independent RNG streams so worker processes never share random state
+    seeds = np.random.SeedSequence().spawn(DAYS_OF_HISTORY)
     total_events = 0
     
-    for day_offset in range(DAYS_OF_HISTORY):
-        current_date = start_date + timedelta(days=day_offset)
-        day_str = current_date.strftime('%Y%m%d')
-        
-        output_file = OUTPUT_DIR / f'events_{day_str}.json'
-        
-        with open(output_file, 'w') as f:
-            for _ in range(EVENTS_PER_DAY):
-                timestamp = int(current_date.timestamp() * 1000) + random.randint(0, 86400000)
-                event = generate_event(timestamp)
-                f.write(json.dumps(event) + '\n')
-                total_events += 1
-        
-        print(f"Generated {day_str}: {EVENTS_PER_DAY} events")
+    # Days are independent, so each one is generated in its own process
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for day_str, day_events in executor.map(generate_day, day_strs, day_timestamps, seeds):
+            total_events += day_events
+            print(f"Generated {day_str}: {day_events} events")
     
     print(f"\nTotal events generated: {total_events}")
     print(f"Output directory: {OUTPUT_DIR}")
@@ -4,10 +4,11 @@ Apache Pinot PoC - Event Data Generator
 Generates event data and publishes to Kafka
 """
 
-import json
 import random
 import time
 from datetime import datetime
+
+import orjson
 from kafka import KafkaProducer
 from kafka.errors import NoBrokersAvailable
 
@@ -15,12 +16,19 @@ from kafka.errors import NoBrokersAvailable
 KAFKA_BOOTSTRAP_SERVERS = 'localhost:9092'
 KAFKA_TOPIC = 'events-topic'
 EVENTS_PER_SECOND = 10
+# Events released per pacing tick; the generator sleeps once per burst
+EVENTS_PER_BURST = 10
+
+# Producer batching: wait up to LINGER_MS to fill BATCH_SIZE bytes per partition
+LINGER_MS = 100
+BATCH_SIZE = 65536
+COMPRESSION_TYPE = 'lz4'
 
 # Data generators
-EVENT_TYPES = ['page_view', 'product_view', 'add_to_cart', 'purchase', 'search', 'login', 'logout']
-CATEGORIES = ['electronics', 'clothing', 'books', 'home', 'sports', 'food', 'toys']
-PLATFORMS = ['web', 'mobile_ios', 'mobile_android', 'tablet']
-COUNTRIES = ['US', 'UK', 'CA', 'DE', 'FR', 'JP', 'BR', 'IN']
+EVENT_TYPES = ('page_view', 'product_view', 'add_to_cart', 'purchase', 'search', 'login', 'logout')
+CATEGORIES = ('electronics', 'clothing', 'books', 'home', 'sports', 'food', 'toys')
+PLATFORMS = ('web', 'mobile_ios', 'mobile_android', 'tablet')
+COUNTRIES = ('US', 'UK', 'CA', 'DE', 'FR', 'JP', 'BR', 'IN')
 CITIES = {
     'US': ['New York', 'Los Angeles', 'Chicago', 'Houston', 'Phoenix'],
     'UK': ['London', 'Manchester', 'Birmingham', 'Leeds', 'Glasgow'],
@@ -31,41 +39,54 @@ CITIES = {
     'BR': ['São Paulo', 'Rio de Janeiro', 'Brasília', 'Salvador', 'Fortaleza'],
     'IN': ['Mumbai', 'Delhi', 'Bangalore', 'Hyderabad', 'Chennai']
 }
-DEVICE_TYPES = ['desktop', 'mobile', 'tablet']
+DEVICE_TYPES = ('desktop', 'mobile', 'tablet')
+
+# Cities laid out in COUNTRIES order so a single country index selects both
+CITIES_BY_COUNTRY = tuple(tuple(CITIES[country]) for country in COUNTRIES)
+
+# Metric ranges per event type as (amount_lo, amount_hi, quantity_lo,
+# quantity_hi, duration_lo, duration_hi); zero-width ranges yield 0
+EVENT_METRICS = {
+    'purchase': (10.0, 500.0, 1, 5, 0, 0),
+    'product_view': (0.0, 0.0, 0, 0, 5, 300),
+}
+DEFAULT_EVENT_METRICS = (0.0, 0.0, 0, 0, 1, 60)
+# Aligned with EVENT_TYPES so the drawn event type index selects its rule
+EVENT_METRIC_RULES = tuple(EVENT_METRICS.get(t, DEFAULT_EVENT_METRICS) for t in EVENT_TYPES)
+
+# Formatted once at import; generate_event indexes them with the randint draw
+USER_IDS = tuple(f'user_{i}' for i in range(10001))
+PRODUCT_IDS = tuple(f'prod_{i}' for i in range(1001))
 
 def generate_event():
     """Generate a single event record"""
-    country = random.choice(COUNTRIES)
-    event_type = random.choice(EVENT_TYPES)
+    choice = random.choice
+    randint = random.randint
+    
+    country_i = random.randrange(len(COUNTRIES))
+    now_ms = int(time.time() * 1000)
+    event_type_i = random.randrange(len(EVENT_TYPES))
+    amount_lo, amount_hi, quantity_lo, quantity_hi, duration_lo, duration_hi = \
+        EVENT_METRIC_RULES[event_type_i]
     
     event = {
-        'event_id': f'evt_{int(time.time() * 1000)}_{random.randint(1000, 9999)}',
-        'user_id': f'user_{random.randint(1, 10000)}',
-        'event_type': event_type,
-        'product_id': f'prod_{random.randint(1, 1000)}',
-        'category': random.choice(CATEGORIES),
-        'platform': random.choice(PLATFORMS),
-        'country': country,
-        'city': random.choice(CITIES[country]),
-        'device_type': random.choice(DEVICE_TYPES),
-        'session_id': f'sess_{random.randint(100000, 999999)}',
-        'event_time': int(time.time() * 1000)
+        'event_id': f'evt_{now_ms}_{randint(1000, 9999)}',
+        'user_id': USER_IDS[randint(1, 10000)],
+        'event_type': EVENT_TYPES[event_type_i],
+        'product_id': PRODUCT_IDS[randint(1, 1000)],
+        'category': choice(CATEGORIES),
+        'platform': choice(PLATFORMS),
+        'country': COUNTRIES[country_i],
+        'city': choice(CITIES_BY_COUNTRY[country_i]),
+        'device_type': choice(DEVICE_TYPES),
+        'session_id': f'sess_{randint(100000, 999999)}',
+        'event_time': now_ms,
+        # Metrics based on event type
+        'amount': round(random.uniform(amount_lo, amount_hi), 2),
+        'quantity': randint(quantity_lo, quantity_hi),
+        'duration_seconds': randint(duration_lo, duration_hi)
     }
     
-    # Add metrics based on event type
-    if event_type == 'purchase':
-        event['amount'] = round(random.uniform(10.0, 500.0), 2)
-        event['quantity'] = random.randint(1, 5)
-        event['duration_seconds'] = 0
-    elif event_type == 'product_view':
-        event['amount'] = 0.0
-        event['quantity'] = 0
-        event['duration_seconds'] = random.randint(5, 300)
-    else:
-        event['amount'] = 0.0
-        event['quantity'] = 0
-        event['duration_seconds'] = random.randint(1, 60)
-    
     return event
 
 def create_kafka_producer():
@@ -77,9 +98,12 @@ def create_kafka_producer():
         try:
             producer = KafkaProducer(
                 bootstrap_servers=KAFKA_BOOTSTRAP_SERVERS,
-                value_serializer=lambda v: json.dumps(v).encode('utf-8'),
-                acks='all',
-                retries=3
+                value_serializer=orjson.dumps,
+                acks=1,
+                retries=3,
+                linger_ms=LINGER_MS,
+                batch_size=BATCH_SIZE,
+                compression_type=COMPRESSION_TYPE
             )
             print(f"Connected to Kafka at {KAFKA_BOOTSTRAP_SERVERS}")
             return producer
@@ -90,6 +114,10 @@ def create_kafka_producer():
             else:
                 raise
 
+def on_send_error(exc):
+    """Report a message the producer failed to deliver"""
+    print(f"Failed to send event: {exc}")
+
 def main():
     """Data generation loop"""
     print("Starting event data generator...")
@@ -101,20 +129,30 @@ def main():
     events_sent = 0
     start_time = time.time()
     
+    # Deadline pacing: bursts are scheduled against the monotonic clock, so
+    # time spent generating and sending does not slow the average rate
+    burst_interval = EVENTS_PER_BURST / EVENTS_PER_SECOND
+    next_deadline = time.monotonic()
+    
     try:
         while True:
-            event = generate_event()
-            producer.send(KAFKA_TOPIC, value=event)
-            events_sent += 1
-            
-            # Log progress every 100 events
-            if events_sent % 100 == 0:
-                elapsed = time.time() - start_time
-                rate = events_sent / elapsed if elapsed > 0 else 0
-                print(f"Sent {events_sent} events (Rate: {rate:.2f} events/sec)")
+            for _ in range(EVENTS_PER_BURST):
+                event = generate_event()
+                # Fire-and-forget: only failures are reported, via the errback
+                producer.send(KAFKA_TOPIC, value=event).add_errback(on_send_error)
+                events_sent += 1
+                
+                # Log progress every 100 events
+                if events_sent % 100 == 0:
+                    elapsed = time.time() - start_time
+                    rate = events_sent / elapsed if elapsed > 0 else 0
+                    print(f"Sent {events_sent} events (Rate: {rate:.2f} events/sec)")
             
             # Control rate
-            time.sleep(1.0 / EVENTS_PER_SECOND)
+            next_deadline += burst_interval
+            sleep_for = next_deadline - time.monotonic()
+            if sleep_for > 0:
+                time.sleep(sleep_for)
             
     except KeyboardInterrupt:
         print("\nShutting down gracefully...")
@@ -8,13 +8,18 @@ import time
 import random
 import json
 import sys
+from bisect import bisect
+from itertools import accumulate
 from datetime import datetime, timezone
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
 
 # Configuration for Podman environment
 DEMO_CONFIG = {
     "duration_minutes": 3,
     "transactions_per_second": 0.8,  # Slightly higher rate for impact
+    "batch_size": 16,  # Max transactions per INSERT/commit
+    "flush_interval_seconds": 2.0,  # Keep dashboards live at low rates
+    "insert_retries": 3,  # Retries before a failing batch is dropped
     "db_config": {
         "host": "localhost",
         "port": 5432,
@@ -86,37 +91,55 @@ CHANNELS = {
     "Store": 0.10
 }
 
+# Transaction counts that trigger a milestone summary
+MILESTONES = frozenset({10, 25, 50, 100})
+
+# Black Friday / high-activity scenario
+CATEGORY_WEIGHTS = {"Electronics": 0.6, "Fashion": 0.25, "Home": 0.10, "Luxury": 0.05}
+
+# Choices paired with cumulative weights, built once so each weighted pick
+# in the generator loop is a single bisect
+CATEGORY_CHOICES = (list(CATEGORY_WEIGHTS), list(accumulate(CATEGORY_WEIGHTS.values())))
+PAYMENT_CHOICES = (list(PAYMENT_METHODS), list(accumulate(PAYMENT_METHODS.values())))
+CHANNEL_CHOICES = (list(CHANNELS), list(accumulate(CHANNELS.values())))
+
+# Products flattened into parallel columns addressed by a global product index,
+# with each category's product indices paired with cumulative popularity
+FLAT_PRODUCTS = [(category, p) for category, products in PRODUCTS.items() for p in products]
+PRODUCT_NAMES = tuple(p["name"] for _, p in FLAT_PRODUCTS)
+PRODUCT_PRICE_LOW = tuple(p["price_range"][0] for _, p in FLAT_PRODUCTS)
+PRODUCT_PRICE_HIGH = tuple(p["price_range"][1] for _, p in FLAT_PRODUCTS)
+PRODUCT_CHOICES = {
+    category: (
+        [i for i, (c, _) in enumerate(FLAT_PRODUCTS) if c == category],
+        list(accumulate(p["popularity"] for p in products))
+    )
+    for category, products in PRODUCTS.items()
+}
+
 def check_dependencies():
     """Check if required dependencies are installed"""
     try:
-        import psycopg2
+        import psycopg
         return True
     except ImportError:
-        print("❌ Required dependency missing: psycopg2")
-        print("Install with: pip3 install psycopg2-binary")
+        print("❌ Required dependency missing: psycopg")
+        print("Install with: pip3 install 'psycopg[binary]'")
         return False
 
-def get_weighted_choice(choices_dict: Dict[str, float]) -> str:
-    """Select item based on weighted probabilities"""
-    choices = list(choices_dict.keys())
-    weights = list(choices_dict.values())
-    return random.choices(choices, weights=weights)[0]
+def get_weighted_choice(choices: List[Any], cum_weights: List[float]) -> Any:
+    """Select item based on precomputed cumulative weights"""
+    return choices[bisect(cum_weights, random.random() * cum_weights[-1])]
 
 def generate_premium_transaction() -> Dict[str, Any]:
     """Generate a high-impact transaction for demo effect"""
-    # Black Friday / high-activity scenario
-    category_weights = {"Electronics": 0.6, "Fashion": 0.25, "Home": 0.10, "Luxury": 0.05}
-    category = get_weighted_choice(category_weights)
+    category = get_weighted_choice(*CATEGORY_CHOICES)
     
-    products = PRODUCTS[category]
     # Bias toward popular products for demo effect
-    product = random.choices(
-        products, 
-        weights=[p["popularity"] for p in products]
-    )[0]
+    product_i = get_weighted_choice(*PRODUCT_CHOICES[category])
     
     # Add realistic price variance
-    base_price = random.uniform(*product["price_range"])
+    base_price = random.uniform(PRODUCT_PRICE_LOW[product_i], PRODUCT_PRICE_HIGH[product_i])
     # Black Friday discount for some items
     if random.random() < 0.3:  # 30% chance of discount
         price = base_price * random.uniform(0.85, 0.95)  # 5-15% off
@@ -131,30 +154,32 @@ def generate_premium_transaction() -> Dict[str, Any]:
     
     return {
         "customer_name": random.choice(CUSTOMERS),
-        "product_name": product["name"],
+        "product_name": PRODUCT_NAMES[product_i],
         "category": category,
         "region": random.choice(REGIONS),
         "amount": price,
-        "payment_method": get_weighted_choice(PAYMENT_METHODS),
-        "channel": get_weighted_choice(CHANNELS)
+        "payment_method": get_weighted_choice(*PAYMENT_CHOICES),
+        "channel": get_weighted_choice(*CHANNEL_CHOICES)
     }
 
 def create_database_connection():
     """Create database connection with better error handling"""
+    import psycopg
+    
     try:
-        import psycopg2
-        
-        conn = psycopg2.connect(
+        # prepare_threshold=0 makes the server prepare the INSERT on first use
+        conn = psycopg.connect(
             host=DEMO_CONFIG["db_config"]["host"],
             port=DEMO_CONFIG["db_config"]["port"],
-            database=DEMO_CONFIG["db_config"]["database"],
+            dbname=DEMO_CONFIG["db_config"]["database"],
             user=DEMO_CONFIG["db_config"]["user"],
             password=DEMO_CONFIG["db_config"]["password"],
-            connect_timeout=10
+            connect_timeout=10,
+            prepare_threshold=0
         )
         return conn
     
-    except psycopg2.OperationalError as e:
+    except psycopg.OperationalError as e:
         if "Connection refused" in str(e):
             print("❌ Cannot connect to database. Is Podman running?")
             print("Try: podman compose -f docker-compose-podman.yml ps")
@@ -165,8 +190,8 @@ def create_database_connection():
         print(f"❌ Unexpected error connecting to database: {e}")
         return None
 
-def insert_transaction(cursor, transaction: Dict[str, Any]) -> bool:
-    """Insert transaction with error handling"""
+def insert_transactions(cursor, transactions: List[Dict[str, Any]]) -> bool:
+    """Insert a batch of transactions with one prepared, pipelined statement"""
     try:
         query = """
         INSERT INTO demo.live_sales 
@@ -174,12 +199,58 @@ def insert_transaction(cursor, transaction: Dict[str, Any]) -> bool:
         VALUES (%(customer_name)s, %(product_name)s, %(category)s, %(region)s, 
                 %(amount)s, %(payment_method)s, %(channel)s, NOW())
         """
-        cursor.execute(query, transaction)
+        cursor.executemany(query, transactions)
         return True
     except Exception as e:
-        print(f"⚠️  Failed to insert transaction: {e}")
+        print(f"⚠️  Failed to insert {len(transactions)} transactions: {e}")
         return False
 
+def format_transaction(transaction_count: int, total_revenue: float,
+                       transaction: Dict[str, Any]) -> str:
+    """Format a committed transaction and any milestone it reaches"""
+    # Enhanced console output for presentation effect
+    output = (f"#{transaction_count:03d} | "
+              f"{transaction['customer_name']:<18} | "
+              f"{transaction['product_name']:<25} | "
+              f"${transaction['amount']:>8,.2f} | "
+              f"{transaction['region']:<12}\n")
+    
+    # Show milestone messages
+    if transaction_count in MILESTONES:
+        output += (f"\nMilestone: {transaction_count} transactions completed!\n"
+                   f"Total Revenue: ${total_revenue:,.2f}\n"
+                   f"Average Order Value: ${total_revenue/transaction_count:,.2f}\n\n")
+    
+    return output
+
+def flush_transactions(conn, cursor, transactions: List[Dict[str, Any]],
+                       transaction_count: int, total_revenue: float) -> Tuple[int, float]:
+    """Insert and commit a batch, retrying a few times before dropping it
+    
+    Committed transactions are printed; returns the updated totals.
+    """
+    retries = DEMO_CONFIG["insert_retries"]
+    for attempt in range(retries + 1):
+        if insert_transactions(cursor, transactions):
+            conn.commit()
+            output = []
+            for transaction in transactions:
+                transaction_count += 1
+                total_revenue += transaction["amount"]
+                output.append(format_transaction(transaction_count, total_revenue, transaction))
+            # One terminal write per committed batch
+            sys.stdout.write("".join(output))
+            sys.stdout.flush()
+            return transaction_count, total_revenue
+        
+        conn.rollback()
+        if attempt < retries:
+            print("⚠️  Batch insert failed, retrying...")
+            time.sleep(0.5)
+    
+    print(f"⚠️  Dropping {len(transactions)} transactions after {retries} retries")
+    return transaction_count, total_revenue
+
 def print_demo_header():
     """Print attractive demo header"""
     print("=" * 62)
@@ -221,37 +292,30 @@ def simulate_live_demo():
     print("Dashboard: http://localhost:8088")
     print()
     
+    # Transactions are buffered and written with one INSERT + commit per batch
+    pending = []
+    last_flush = time.time()
+    
+    # Loop-invariant settings, read once instead of on every iteration
+    batch_size = DEMO_CONFIG["batch_size"]
+    flush_interval = DEMO_CONFIG["flush_interval_seconds"]
+    period = 1 / DEMO_CONFIG["transactions_per_second"]
+    
     try:
         while time.time() < end_time:
             # Generate transaction
-            transaction = generate_premium_transaction()
+            pending.append(generate_premium_transaction())
             
-            # Insert to database
-            if insert_transaction(cursor, transaction):
-                conn.commit()
-                transaction_count += 1
-                total_revenue += transaction["amount"]
-                
-                # Enhanced console output for presentation effect
-                print(f"#{transaction_count:03d} | "
-                      f"{transaction['customer_name']:<18} | "
-                      f"{transaction['product_name']:<25} | "
-                      f"${transaction['amount']:>8,.2f} | "
-                      f"{transaction['region']:<12}")
-                
-                # Show milestone messages
-                if transaction_count in [10, 25, 50, 100]:
-                    print()
-                    print(f"Milestone: {transaction_count} transactions completed!")
-                    print(f"Total Revenue: ${total_revenue:,.2f}")
-                    print(f"Average Order Value: ${total_revenue/transaction_count:,.2f}")
-                    print()
-                
-                # Wait between transactions
-                time.sleep(1 / DEMO_CONFIG["transactions_per_second"])
-            else:
-                print("⚠️  Transaction insert failed, retrying...")
-                time.sleep(0.5)
+            now = time.time()
+            if len(pending) >= batch_size or now - last_flush >= flush_interval:
+                # Insert to database
+                transaction_count, total_revenue = flush_transactions(
+                    conn, cursor, pending, transaction_count, total_revenue)
+                pending = []
+                last_flush = now
+            
+            # Wait between transactions
+            time.sleep(period)
     
     except KeyboardInterrupt:
         print("\nDemo simulation stopped by user")
@@ -260,6 +324,14 @@ def simulate_live_demo():
         print(f"\n❌ Simulation error: {e}")
     
     finally:
+        # Flush whatever is still buffered before closing
+        if pending and not conn.closed:
+            try:
+                transaction_count, total_revenue = flush_transactions(
+                    conn, cursor, pending, transaction_count, total_revenue)
+            except Exception as e:
+                print(f"⚠️  Failed to flush pending transactions: {e}")
+        
         # Cleanup and summary
         if cursor:
             cursor.close()
@@ -4,12 +4,18 @@ datapreview - Command-line data file explorer and profiler.
 
 Provides quick preview and statistical analysis for CSV, Parquet, and JSON files.
 """
+import io
 import json
 import sys
 from pathlib import Path
 from typing import Optional
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.dataset as pads
+import pyarrow.parquet as pq
 import typer
 from rich.console import Console
 from rich.table import Table
@@ -17,11 +23,20 @@ from rich.table import Table
 app = typer.Typer(help="Quick data file exploration and profiling.")
 console = Console()
 
+# Row separators double Rich's layout work, so larger previews are drawn without them
+PREVIEW_SEPARATOR_MAX_ROWS = 20
+
 
 class DataProfiler:
     """Handles data loading, profiling, and statistics generation."""
 
     SUPPORTED_FORMATS = {".csv", ".parquet", ".json"}
+    # Arrow parses CSV in blocks of this many bytes, using all cores
+    CSV_BLOCK_SIZE = 16 * 1024 * 1024
+    # JSON is read in chunks of this many characters when only the head is needed
+    JSON_READ_SIZE = 1024 * 1024
+    # Text columns with fewer distinct values than this share of rows load as categoricals
+    CATEGORY_MAX_UNIQUE_RATIO = 0.5
 
     def __init__(self, filepath: Path):
         self.filepath = filepath
@@ -44,32 +59,150 @@ class DataProfiler:
         suffix = self.filepath.suffix.lower()
 
         if suffix == ".csv":
-            self.df = pd.read_csv(self.filepath, nrows=nrows)
+            self.df = self._to_pandas(self._read_csv(nrows))
         elif suffix == ".parquet":
-            self.df = pd.read_parquet(self.filepath)
-            if nrows:
-                self.df = self.df.head(nrows)
+            dataset = pads.dataset(self.filepath, format="parquet")
+            # head() stops decoding row groups once nrows rows are read
+            table = dataset.head(nrows) if nrows else dataset.to_table()
+            self.df = self._to_pandas(table)
         elif suffix == ".json":
-            self.df = pd.read_json(self.filepath)
-            if nrows:
-                self.df = self.df.head(nrows)
+            head = self._read_json_head(nrows) if nrows else None
+            if head is None:
+                head = pd.read_json(self.filepath)
+                if nrows:
+                    head = head.head(nrows)
+            self.df = head
 
         return self.df
 
+    def _read_csv(self, nrows: Optional[int] = None) -> pa.Table:
+        """Read a CSV with Arrow, stopping after nrows rows when given."""
+        read_options = pacsv.ReadOptions(block_size=self.CSV_BLOCK_SIZE)
+        # Match pandas, which reads empty text fields as missing values
+        convert_options = pacsv.ConvertOptions(strings_can_be_null=True)
+
+        if not nrows:
+            return pacsv.read_csv(self.filepath, read_options=read_options, convert_options=convert_options)
+
+        batches = []
+        remaining = nrows
+        with pacsv.open_csv(self.filepath, read_options=read_options, convert_options=convert_options) as reader:
+            for batch in reader:
+                batches.append(batch.slice(0, remaining))
+                remaining -= batches[-1].num_rows
+                if remaining <= 0:
+                    break
+            return pa.Table.from_batches(batches, schema=reader.schema)
+
+    def _read_json_head(self, nrows: int) -> Optional[pd.DataFrame]:
+        """Parse only the first nrows records of a JSON array of objects.
+
+        Returns None when the file holds some other JSON layout, so the
+        caller can fall back to pandas reading the whole document.
+        """
+        decoder = json.JSONDecoder()
+        records = []
+        with self.filepath.open(encoding="utf-8") as f:
+            buffer = f.read(self.JSON_READ_SIZE).lstrip()
+            if not buffer.startswith("["):
+                return None
+
+            pos = 1
+            eof = False
+            while len(records) < nrows:
+                while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                    pos += 1
+                if buffer.startswith("]", pos):
+                    break
+                try:
+                    record, pos = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    # The next record is cut off at the end of the buffer
+                    if eof:
+                        raise
+                    chunk = f.read(self.JSON_READ_SIZE)
+                    eof = not chunk
+                    buffer, pos = buffer[pos:] + chunk, 0
+                    continue
+                if not isinstance(record, dict):
+                    return None
+                records.append(record)
+
+        # Round-trip through read_json so dtypes are inferred as for a full load
+        return pd.read_json(io.StringIO(json.dumps(records)))
+
+    def _to_pandas(self, table: pa.Table) -> pd.DataFrame:
+        """Convert an Arrow table, dictionary-encoding low-cardinality text columns."""
+        max_unique = table.num_rows * self.CATEGORY_MAX_UNIQUE_RATIO
+        for i, field in enumerate(table.schema):
+            if not (pa.types.is_string(field.type) or pa.types.is_large_string(field.type)):
+                continue
+            column = table.column(i)
+            # Dictionary columns become pandas categoricals: one copy of each value
+            if pc.count_distinct(column).as_py() < max_unique:
+                table = table.set_column(i, field.name, column.dictionary_encode())
+        return table.to_pandas()
+
     def get_schema(self) -> list[dict]:
         """Extract schema information from the DataFrame."""
         if self.df is None:
             self.load()
 
         schema = []
-        for col in self.df.columns:
+        has_nulls = self.df.isna().any()
+        for col, dtype, nullable in zip(self.df.columns, self.df.dtypes, has_nulls):
             schema.append({
                 "column": col,
-                "dtype": str(self.df[col].dtype),
-                "nullable": self.df[col].isna().any(),
+                "dtype": str(dtype),
+                "nullable": nullable,
             })
         return schema
 
+    def get_schema_fast(self) -> list[dict]:
+        """Extract schema information without loading any rows.
+
+        Parquet schemas come from the file footer and CSV schemas from
+        Arrow's type inference on the first block, so both report Arrow
+        types rather than the pandas dtypes load() produces. Nullability is
+        the declared one for Parquet; a CSV declares none, so it is unknown.
+        JSON has no metadata to read, so only its first record is parsed.
+        """
+        suffix = self.filepath.suffix.lower()
+
+        if suffix == ".parquet":
+            return [
+                {"column": field.name, "dtype": str(field.type), "nullable": field.nullable}
+                for field in pq.read_schema(self.filepath)
+            ]
+        if suffix == ".csv":
+            read_options = pacsv.ReadOptions(block_size=self.CSV_BLOCK_SIZE)
+            convert_options = pacsv.ConvertOptions(strings_can_be_null=True)
+            with pacsv.open_csv(self.filepath, read_options=read_options, convert_options=convert_options) as reader:
+                return [
+                    {"column": field.name, "dtype": str(field.type), "nullable": None}
+                    for field in reader.schema
+                ]
+
+        self.load(nrows=1)
+        return self.get_schema()
+
+    def optimize_dtypes(self) -> pd.DataFrame:
+        """Downcast numeric columns to the smallest dtype that holds their values."""
+        if self.df is None:
+            self.load()
+
+        for i, dtype in enumerate(self.df.dtypes):
+            column = self.df.iloc[:, i]
+            if pd.api.types.is_integer_dtype(dtype):
+                self.df.isetitem(i, pd.to_numeric(column, downcast="integer"))
+            elif pd.api.types.is_float_dtype(dtype):
+                downcast = pd.to_numeric(column, downcast="float")
+                # float32 cannot represent most decimals, so only keep lossless downcasts
+                if downcast.astype(dtype).equals(column):
+                    self.df.isetitem(i, downcast)
+
+        return self.df
+
     def get_statistics(self) -> dict:
         """Generate comprehensive statistics for the dataset."""
         if self.df is None:
@@ -83,20 +216,30 @@ class DataProfiler:
             "column_stats": [],
         }
 
-        for col in self.df.columns:
+        # Whole-frame reductions instead of rescanning each column per statistic
+        null_counts = self.df.isna().sum()
+        null_pcts = (null_counts / len(self.df) * 100).round(1)
+        uniques = self.df.nunique()
+        numeric_cols = [col for col, dtype in self.df.dtypes.items() if pd.api.types.is_numeric_dtype(dtype)]
+        numeric_stats = self.df[numeric_cols].agg(["min", "max", "mean"]) if numeric_cols else pd.DataFrame()
+
+        for col, dtype, null_count, null_pct, unique in zip(
+            self.df.columns, self.df.dtypes, null_counts, null_pcts, uniques
+        ):
             col_stats = {
                 "column": col,
-                "dtype": str(self.df[col].dtype),
-                "null_count": int(self.df[col].isna().sum()),
-                "null_pct": round(self.df[col].isna().mean() * 100, 1),
-                "unique": int(self.df[col].nunique()),
+                "dtype": str(dtype),
+                "null_count": int(null_count),
+                "null_pct": null_pct,
+                "unique": int(unique),
             }
 
             # Add numeric statistics for applicable columns
-            if pd.api.types.is_numeric_dtype(self.df[col]):
-                col_stats["min"] = float(self.df[col].min()) if not self.df[col].isna().all() else None
-                col_stats["max"] = float(self.df[col].max()) if not self.df[col].isna().all() else None
-                col_stats["mean"] = round(float(self.df[col].mean()), 2) if not self.df[col].isna().all() else None
+            if col in numeric_stats:
+                all_null = null_count == len(self.df)
+                col_stats["min"] = float(numeric_stats.at["min", col]) if not all_null else None
+                col_stats["max"] = float(numeric_stats.at["max", col]) if not all_null else None
+                col_stats["mean"] = round(float(numeric_stats.at["mean", col]), 2) if not all_null else None
 
             stats["column_stats"].append(col_stats)
 
@@ -105,13 +248,20 @@ class DataProfiler:
 
 def render_preview(df: pd.DataFrame, title: str, max_rows: int = 10) -> None:
     """Render a formatted preview table of the DataFrame."""
-    table = Table(title=title, show_lines=True)
+    if min(max_rows, len(df)) <= PREVIEW_SEPARATOR_MAX_ROWS:
+        table = Table(title=title, show_lines=True)
+    else:
+        # Alternate row shading keeps wrapped rows apart without separators
+        table = Table(title=title, row_styles=["", "dim"])
 
     for col in df.columns:
         table.add_column(str(col), overflow="fold")
 
-    for _, row in df.head(max_rows).iterrows():
-        table.add_row(*[str(v) if pd.notna(v) else "NULL" for v in row])
+    # Plain object arrays avoid boxing every row into a Series
+    head = df.head(max_rows)
+    present = head.notna().to_numpy()
+    for values, mask in zip(head.to_numpy(dtype=object), present):
+        table.add_row(*[str(v) if ok else "NULL" for v, ok in zip(values, mask)])
 
     console.print(table)
     console.print(f"\nShowing {min(max_rows, len(df))} of {len(df)} rows\n")
@@ -128,7 +278,7 @@ def render_schema(schema: list[dict]) -> None:
         table.add_row(
             col["column"],
             col["dtype"],
-            "Yes" if col["nullable"] else "No"
+            "Unknown" if col["nullable"] is None else "Yes" if col["nullable"] else "No"
         )
 
     console.print(table)
@@ -191,13 +341,13 @@ def main(
         profiler = DataProfiler(filepath)
 
         if schema:
-            profiler.load(nrows=1)
-            render_schema(profiler.get_schema())
+            render_schema(profiler.get_schema_fast())
             return
 
         profiler.load()
 
         if stats:
+            profiler.optimize_dtypes()
             statistics = profiler.get_statistics()
             render_statistics(statistics)
 
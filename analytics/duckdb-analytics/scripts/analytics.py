@@ -5,39 +5,88 @@ Demonstrates DuckDB capabilities for OLAP workloads including
 aggregations, window functions, and complex joins.
 """
 
-from pathlib import Path
-from typing import Optional
+import os
+from typing import Optional, Union
 
 import duckdb
+import pyarrow as pa
 from rich.console import Console
 from rich.table import Table
 
-DATA_DIR = Path(__file__).parent.parent / "data" / "processed"
+from transform import register_views
+
 console = Console()
 
+# Connection settings: use every core, cache Parquet metadata across queries,
+# and let operators skip order bookkeeping (every report has its own ORDER BY)
+DUCKDB_CONFIG = {
+    "threads": os.cpu_count() or 1,
+    "enable_object_cache": True,
+    "preserve_insertion_order": False,
+}
+# Optional cap such as "8GB"; DuckDB defaults to 80% of system memory
+DUCKDB_MEMORY_LIMIT = os.environ.get("DUCKDB_MEMORY_LIMIT")
+
+# Primary key checked for nulls in the data quality summary
+PRIMARY_KEYS = {
+    "transactions": "transaction_id",
+    "products": "product_id",
+    "customers": "customer_id",
+    "stores": "store_id",
+}
+
+# Every table is counted in a single UNION ALL query
+DATA_QUALITY_QUERY = " UNION ALL ".join(
+    f"SELECT '{table}' AS table_name, COUNT(*) AS row_count, "
+    f"COUNT(*) - COUNT({pk_col}) AS null_pks FROM {table}"
+    for table, pk_col in PRIMARY_KEYS.items()
+)
+
 
 def create_connection() -> duckdb.DuckDBPyConnection:
     """Create DuckDB connection with Parquet files registered as views."""
-    conn = duckdb.connect()
+    config = dict(DUCKDB_CONFIG)
+    if DUCKDB_MEMORY_LIMIT:
+        config["memory_limit"] = DUCKDB_MEMORY_LIMIT
+    conn = duckdb.connect(config=config)
 
-    # Register Parquet files as views
-    for parquet_file in DATA_DIR.glob("*.parquet"):
-        table_name = parquet_file.stem
-        conn.execute(f"""
-            CREATE VIEW {table_name} AS 
-            SELECT * FROM read_parquet('{parquet_file}')
-        """)
+    register_views(conn)
 
     return conn
 
 
-def print_result(title: str, result: list, columns: list):
+def create_valid_transactions(conn: duckdb.DuckDBPyConnection):
+    """Materialize non-returned transactions once for the reports that share them."""
+    conn.execute("""
+        CREATE TEMP TABLE valid_transactions AS
+        SELECT
+            transaction_id,
+            transaction_date,
+            customer_id,
+            product_id,
+            store_id,
+            quantity,
+            total_amount,
+            payment_method
+        FROM transactions
+        WHERE is_returned = FALSE
+    """)
+
+
+def print_result(title: str, result: Union[list, pa.Table, pa.RecordBatchReader], columns: list):
     """Print query results in formatted table."""
     table = Table(title=title, show_header=True, header_style="bold")
 
     for col in columns:
         table.add_column(col)
 
+    # Newer DuckDB releases return a batch reader from .arrow()
+    if isinstance(result, pa.RecordBatchReader):
+        result = result.read_all()
+    if isinstance(result, pa.Table):
+        # Arrow results are converted column by column, then zipped into rows
+        result = zip(*(column.to_pylist() for column in result.columns))
+
     for row in result:
         table.add_row(*[str(v) for v in row])
 
@@ -54,13 +103,12 @@ def revenue_by_category(conn: duckdb.DuckDBPyConnection):
             SUM(t.quantity) AS units_sold,
             ROUND(SUM(t.total_amount), 2) AS total_revenue,
             ROUND(AVG(t.total_amount), 2) AS avg_transaction
-        FROM transactions t
+        FROM valid_transactions t
         JOIN products p ON t.product_id = p.product_id
-        WHERE t.is_returned = FALSE
         GROUP BY p.category
         ORDER BY total_revenue DESC
     """
-    result = conn.execute(query).fetchall()
+    result = conn.execute(query).arrow()
     columns = ["Category", "Transactions", "Units Sold", "Revenue", "Avg Transaction"]
     print_result("Revenue by Product Category", result, columns)
 
@@ -73,8 +121,7 @@ def monthly_sales_trend(conn: duckdb.DuckDBPyConnection):
                 DATE_TRUNC('month', transaction_date) AS month,
                 COUNT(*) AS transactions,
                 ROUND(SUM(total_amount), 2) AS revenue
-            FROM transactions
-            WHERE is_returned = FALSE
+            FROM valid_transactions
             GROUP BY DATE_TRUNC('month', transaction_date)
         )
         SELECT 
@@ -90,14 +137,14 @@ def monthly_sales_trend(conn: duckdb.DuckDBPyConnection):
         ORDER BY month DESC
         LIMIT 12
     """
-    result = conn.execute(query).fetchall()
+    result = conn.execute(query).arrow()
     columns = ["Month", "Transactions", "Revenue", "MoM Growth %"]
     print_result("Monthly Sales Trend (Last 12 Months)", result, columns)
 
 
 def top_customers(conn: duckdb.DuckDBPyConnection, limit: int = 10):
     """Top customers by total spend with segment information."""
-    query = f"""
+    query = """
         SELECT 
             c.customer_id,
             c.first_name || ' ' || c.last_name AS customer_name,
@@ -105,14 +152,13 @@ def top_customers(conn: duckdb.DuckDBPyConnection, limit: int = 10):
             COUNT(DISTINCT t.transaction_id) AS orders,
             ROUND(SUM(t.total_amount), 2) AS total_spend,
             ROUND(AVG(t.total_amount), 2) AS avg_order_value
-        FROM transactions t
+        FROM valid_transactions t
         JOIN customers c ON t.customer_id = c.customer_id
-        WHERE t.is_returned = FALSE
         GROUP BY c.customer_id, c.first_name, c.last_name, c.segment
         ORDER BY total_spend DESC
-        LIMIT {limit}
+        LIMIT ?
     """
-    result = conn.execute(query).fetchall()
+    result = conn.execute(query, [limit]).arrow()
     columns = ["Customer ID", "Name", "Segment", "Orders", "Total Spend", "AOV"]
     print_result(f"Top {limit} Customers by Spend", result, columns)
 
@@ -127,13 +173,12 @@ def store_performance(conn: duckdb.DuckDBPyConnection):
             COUNT(DISTINCT t.transaction_id) AS transactions,
             ROUND(SUM(t.total_amount), 2) AS revenue,
             ROUND(SUM(t.total_amount) / COUNT(DISTINCT s.store_id), 2) AS revenue_per_store
-        FROM transactions t
+        FROM valid_transactions t
         JOIN stores s ON t.store_id = s.store_id
-        WHERE t.is_returned = FALSE
         GROUP BY s.region, s.store_type
         ORDER BY revenue DESC
     """
-    result = conn.execute(query).fetchall()
+    result = conn.execute(query).arrow()
     columns = ["Region", "Store Type", "Stores", "Transactions", "Revenue", "Revenue/Store"]
     print_result("Store Performance by Region", result, columns)
 
@@ -147,12 +192,11 @@ def payment_method_analysis(conn: duckdb.DuckDBPyConnection):
             ROUND(100.0 * COUNT(*) / SUM(COUNT(*)) OVER (), 1) AS pct_of_total,
             ROUND(SUM(total_amount), 2) AS total_revenue,
             ROUND(AVG(total_amount), 2) AS avg_transaction
-        FROM transactions
-        WHERE is_returned = FALSE
+        FROM valid_transactions
         GROUP BY payment_method
         ORDER BY transactions DESC
     """
-    result = conn.execute(query).fetchall()
+    result = conn.execute(query).arrow()
     columns = ["Payment Method", "Transactions", "% of Total", "Revenue", "Avg Transaction"]
     print_result("Payment Method Analysis", result, columns)
 
@@ -173,7 +217,7 @@ def product_return_rate(conn: duckdb.DuckDBPyConnection):
         GROUP BY p.category
         ORDER BY return_rate_pct DESC
     """
-    result = conn.execute(query).fetchall()
+    result = conn.execute(query).arrow()
     columns = ["Category", "Transactions", "Returns", "Return Rate %"]
     print_result("Return Rate by Category", result, columns)
 
@@ -189,45 +233,26 @@ def customer_segment_analysis(conn: duckdb.DuckDBPyConnection):
             ROUND(SUM(t.total_amount) / COUNT(DISTINCT c.customer_id), 2) AS revenue_per_customer,
             ROUND(AVG(t.total_amount), 2) AS avg_order_value
         FROM customers c
-        LEFT JOIN transactions t ON c.customer_id = t.customer_id AND t.is_returned = FALSE
+        LEFT JOIN valid_transactions t ON c.customer_id = t.customer_id
         GROUP BY c.segment
         ORDER BY revenue_per_customer DESC
     """
-    result = conn.execute(query).fetchall()
+    result = conn.execute(query).arrow()
     columns = ["Segment", "Customers", "Transactions", "Revenue", "Rev/Customer", "AOV"]
     print_result("Customer Segment Analysis", result, columns)
 
 
 def data_quality_summary(conn: duckdb.DuckDBPyConnection):
     """Data quality metrics for all tables."""
-    tables = ["transactions", "products", "customers", "stores"]
-    results = []
-
-    for table in tables:
-        query = f"SELECT COUNT(*) FROM {table}"
-        row_count = conn.execute(query).fetchone()[0]
-
-        # Check for potential issues
-        null_query = f"""
-            SELECT COUNT(*) 
-            FROM {table} 
-            WHERE {table}_id IS NULL OR {table}_id = ''
-        """
-
-        # Simplified null check for primary key
-        if table == "transactions":
-            pk_col = "transaction_id"
-        elif table == "products":
-            pk_col = "product_id"
-        elif table == "customers":
-            pk_col = "customer_id"
-        else:
-            pk_col = "store_id"
-
-        null_count = conn.execute(f"""
-            SELECT COUNT(*) FROM {table} WHERE {pk_col} IS NULL
-        """).fetchone()[0]
+    counts = {
+        table: (row_count, null_count)
+        for table, row_count, null_count in conn.execute(DATA_QUALITY_QUERY).fetchall()
+    }
 
+    # UNION ALL does not guarantee row order, so report in PRIMARY_KEYS order
+    results = []
+    for table in PRIMARY_KEYS:
+        row_count, null_count = counts[table]
         results.append((table, row_count, null_count, "OK" if null_count == 0 else "WARN"))
 
     columns = ["Table", "Row Count", "Null PKs", "Status"]
@@ -241,6 +266,7 @@ def main():
     console.print()
 
     conn = create_connection()
+    create_valid_transactions(conn)
 
     # Execute all reports
     data_quality_summary(conn)
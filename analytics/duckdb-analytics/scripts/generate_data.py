@@ -5,26 +5,85 @@ Generates realistic transactional data including products, customers,
 stores, and sales transactions for analytical workloads.
 """
 
+import argparse
 import os
-import random
-from datetime import datetime, timedelta
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import partial
 from pathlib import Path
+from typing import Iterable, Iterator
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 from faker import Faker
 
+from transform import (
+    MONTH_PARTITIONS,
+    PARQUET_COMPRESSION,
+    PARQUET_COMPRESSION_LEVEL,
+    PARQUET_ROW_GROUP_SIZE,
+    PARTITION_COLUMN,
+    PROCESSED_DIR,
+    SCHEMAS,
+    parquet_output,
+)
+
 # Configuration
 NUM_PRODUCTS = 500
 NUM_CUSTOMERS = 2000
 NUM_STORES = 25
 NUM_TRANSACTIONS = 50000
 DATE_RANGE_DAYS = 365
+# Faker is called at most this many times per field; rows sample from the pool
+FAKER_POOL_SIZE = 1000
+# Transactions are generated and written in shards of this many rows, in
+# parallel when there is more than one; this bounds peak memory for large runs
+TRANSACTION_SHARD_SIZE = 250_000
 
 OUTPUT_DIR = Path(__file__).parent.parent / "data" / "raw"
 
+# Arrow equivalents of the DuckDB types in transform.SCHEMAS
+ARROW_TYPES = {
+    "VARCHAR": pa.string(),
+    "DOUBLE": pa.float64(),
+    "REAL": pa.float32(),
+    "TINYINT": pa.int8(),
+    "SMALLINT": pa.int16(),
+    "INTEGER": pa.int32(),
+    "BOOLEAN": pa.bool_(),
+    "DATE": pa.date32(),
+    "TIMESTAMP": pa.timestamp("us"),
+}
+
+# Low-cardinality text columns, written as dictionary-encoded Arrow columns so
+# readers get categoricals back; generators build the fixed-vocabulary ones
+# as pandas categoricals from drawn codes
+DICTIONARY_COLUMNS = {
+    "category", "brand", "segment", "state", "country", "region", "store_type", "payment_method",
+}
+
 fake = Faker()
 Faker.seed(42)
-random.seed(42)
+rng = np.random.default_rng(42)
+
+
+def faker_sample(provider: str, size: int) -> np.ndarray:
+    """Sample values of a Faker provider from a pool of at most FAKER_POOL_SIZE draws."""
+    generate = getattr(fake, provider)
+    pool = np.array([generate() for _ in range(min(size, FAKER_POOL_SIZE))])
+    return pool[rng.integers(0, len(pool), size)]
+
+
+def random_dates(start_days_ago: int, end_days_ago: int, size: int) -> np.ndarray:
+    """Draw dates uniformly between start_days_ago and end_days_ago before today."""
+    days_ago = rng.integers(end_days_ago, start_days_ago + 1, size)
+    return np.datetime64(date.today(), "D") - days_ago.astype("timedelta64[D]")
 
 
 def generate_products() -> pd.DataFrame:
@@ -40,29 +99,30 @@ def generate_products() -> pd.DataFrame:
         "Automotive": {"price_range": (14.99, 399.99), "margin": 0.28},
     }
 
-    products = []
-    product_id = 1
-
-    for category, config in categories.items():
-        category_count = NUM_PRODUCTS // len(categories)
-        for _ in range(category_count):
-            price = round(random.uniform(*config["price_range"]), 2)
-            cost = round(price * (1 - config["margin"]), 2)
-            products.append({
-                "product_id": f"PRD{product_id:06d}",
-                "product_name": fake.catch_phrase(),
-                "category": category,
-                "subcategory": fake.word().capitalize(),
-                "brand": fake.company().split()[0],
-                "unit_price": price,
-                "unit_cost": cost,
-                "stock_quantity": random.randint(0, 1000),
-                "is_active": random.choices([True, False], weights=[0.95, 0.05])[0],
-                "created_at": fake.date_between(start_date="-3y", end_date="-1y"),
-            })
-            product_id += 1
-
-    return pd.DataFrame(products)
+    category_count = NUM_PRODUCTS // len(categories)
+    size = category_count * len(categories)
+    configs = list(categories.values())
+
+    # Per-row pricing parameters, one block of rows per category
+    low = np.repeat([c["price_range"][0] for c in configs], category_count)
+    high = np.repeat([c["price_range"][1] for c in configs], category_count)
+    margin = np.repeat([c["margin"] for c in configs], category_count)
+    price = np.round(rng.uniform(low, high), 2)
+
+    return pd.DataFrame({
+        "product_id": np.char.mod("PRD%06d", np.arange(1, size + 1)),
+        "product_name": faker_sample("catch_phrase", size),
+        "category": pd.Categorical.from_codes(
+            np.repeat(np.arange(len(categories)), category_count), list(categories)
+        ),
+        "subcategory": np.char.capitalize(faker_sample("word", size)),
+        "brand": [company.split()[0] for company in faker_sample("company", size)],
+        "unit_price": price,
+        "unit_cost": np.round(price * (1 - margin), 2),
+        "stock_quantity": rng.integers(0, 1001, size).astype(np.int16),
+        "is_active": rng.random(size) < 0.95,
+        "created_at": random_dates(3 * 365, 365, size),
+    })
 
 
 def generate_customers() -> pd.DataFrame:
@@ -70,25 +130,29 @@ def generate_customers() -> pd.DataFrame:
     segments = ["Premium", "Standard", "Basic", "Enterprise"]
     segment_weights = [0.10, 0.50, 0.35, 0.05]
 
-    customers = []
-    for i in range(1, NUM_CUSTOMERS + 1):
-        registration_date = fake.date_between(start_date="-5y", end_date="-30d")
-        customers.append({
-            "customer_id": f"CUS{i:08d}",
-            "first_name": fake.first_name(),
-            "last_name": fake.last_name(),
-            "email": fake.email(),
-            "phone": fake.phone_number(),
-            "segment": random.choices(segments, weights=segment_weights)[0],
-            "city": fake.city(),
-            "state": fake.state_abbr(),
-            "country": "US",
-            "postal_code": fake.zipcode(),
-            "registration_date": registration_date,
-            "is_active": random.choices([True, False], weights=[0.85, 0.15])[0],
-        })
-
-    return pd.DataFrame(customers)
+    first_names = faker_sample("first_name", NUM_CUSTOMERS)
+    last_names = faker_sample("last_name", NUM_CUSTOMERS)
+    emails = np.char.add(
+        np.char.lower(np.char.add(np.char.add(first_names, "."), last_names)),
+        "@example.com"
+    )
+
+    return pd.DataFrame({
+        "customer_id": np.char.mod("CUS%08d", np.arange(1, NUM_CUSTOMERS + 1)),
+        "first_name": first_names,
+        "last_name": last_names,
+        "email": emails,
+        "phone": faker_sample("phone_number", NUM_CUSTOMERS),
+        "segment": pd.Categorical.from_codes(
+            rng.choice(len(segments), size=NUM_CUSTOMERS, p=segment_weights), segments
+        ),
+        "city": faker_sample("city", NUM_CUSTOMERS),
+        "state": faker_sample("state_abbr", NUM_CUSTOMERS),
+        "country": "US",
+        "postal_code": faker_sample("zipcode", NUM_CUSTOMERS),
+        "registration_date": random_dates(5 * 365, 30, NUM_CUSTOMERS),
+        "is_active": rng.random(NUM_CUSTOMERS) < 0.85,
+    })
 
 
 def generate_stores() -> pd.DataFrame:
@@ -101,109 +165,236 @@ def generate_stores() -> pd.DataFrame:
         "West": ["CA", "WA", "OR", "NV", "UT"],
     }
 
-    stores = []
-    store_id = 1
-
-    for region, states in regions.items():
-        stores_per_region = NUM_STORES // len(regions)
-        for _ in range(stores_per_region):
-            state = random.choice(states)
-            stores.append({
-                "store_id": f"STR{store_id:04d}",
-                "store_name": f"{fake.city()} Store",
-                "region": region,
-                "state": state,
-                "city": fake.city(),
-                "address": fake.street_address(),
-                "postal_code": fake.zipcode(),
-                "store_type": random.choice(["Flagship", "Standard", "Outlet"]),
-                "square_footage": random.randint(5000, 50000),
-                "opened_date": fake.date_between(start_date="-10y", end_date="-1y"),
-                "manager_name": fake.name(),
-            })
-            store_id += 1
-
-    return pd.DataFrame(stores)
+    stores_per_region = NUM_STORES // len(regions)
+    size = stores_per_region * len(regions)
+
+    return pd.DataFrame({
+        "store_id": np.char.mod("STR%04d", np.arange(1, size + 1)),
+        "store_name": np.char.add(faker_sample("city", size), " Store"),
+        "region": pd.Categorical.from_codes(
+            np.repeat(np.arange(len(regions)), stores_per_region), list(regions)
+        ),
+        "state": np.concatenate([
+            rng.choice(states, size=stores_per_region) for states in regions.values()
+        ]),
+        "city": faker_sample("city", size),
+        "address": faker_sample("street_address", size),
+        "postal_code": faker_sample("zipcode", size),
+        "store_type": pd.Categorical.from_codes(
+            rng.choice(3, size=size), ["Flagship", "Standard", "Outlet"]
+        ),
+        "square_footage": rng.integers(5000, 50001, size).astype(np.int32),
+        "opened_date": random_dates(10 * 365, 365, size),
+        "manager_name": faker_sample("name", size),
+    })
+
+
+def generate_transaction_shard(
+    first_id: int,
+    size: int,
+    seed: int,
+    product_ids: np.ndarray,
+    unit_prices: np.ndarray,
+    customer_ids: np.ndarray,
+    store_ids: np.ndarray,
+    start_date: datetime,
+    end_date: datetime,
+) -> pd.DataFrame:
+    """Generate one shard of transactions from its own random stream."""
+    shard_rng = np.random.default_rng(seed)
+
+    payment_methods = ["Credit Card", "Debit Card", "Cash", "Digital Wallet"]
+    payment_weights = [0.45, 0.25, 0.15, 0.15]
+
+    # Each column is drawn as a whole array rather than row by row
+    product_idx = shard_rng.integers(0, len(product_ids), size)
+    unit_price = unit_prices[product_idx]
+    quantity = shard_rng.choice(
+        np.arange(1, 6, dtype=np.int8),
+        size=size,
+        p=[0.50, 0.25, 0.15, 0.07, 0.03]
+    )
+
+    # Apply discount based on quantity
+    discount_pct = np.where(
+        quantity >= 3,
+        shard_rng.choice([0.05, 0.10, 0.15], size=size),
+        0.0
+    )
+
+    # Computed in place to avoid a temporary per arithmetic step, from the
+    # float64 discount; only the stored discount column is narrowed
+    total_amount = np.multiply(quantity, unit_price)
+    total_amount *= 1 - discount_pct
+    np.round(total_amount, 2, out=total_amount)
+
+    # Uniform over the date range, at microsecond resolution
+    span_us = int((end_date - start_date) / timedelta(microseconds=1))
+    transaction_date = (
+        np.datetime64(start_date, "us")
+        + shard_rng.integers(0, span_us, size).astype("timedelta64[us]")
+    )
+
+    return pd.DataFrame({
+        "transaction_id": np.char.mod("TXN%010d", np.arange(first_id, first_id + size)),
+        "transaction_date": transaction_date,
+        "customer_id": customer_ids[shard_rng.integers(0, len(customer_ids), size)],
+        "product_id": product_ids[product_idx],
+        "store_id": store_ids[shard_rng.integers(0, len(store_ids), size)],
+        "quantity": quantity,
+        "unit_price": unit_price,
+        "discount_pct": discount_pct.astype(np.float32),
+        "total_amount": total_amount,
+        "payment_method": pd.Categorical.from_codes(
+            shard_rng.choice(len(payment_methods), size=size, p=payment_weights), payment_methods
+        ),
+        "is_returned": shard_rng.random(size) < 0.03,
+    })
 
 
 def generate_transactions(
     products: pd.DataFrame,
     customers: pd.DataFrame,
     stores: pd.DataFrame
-) -> pd.DataFrame:
-    """Generate sales transactions with realistic patterns."""
-    product_ids = products["product_id"].tolist()
-    product_prices = dict(zip(products["product_id"], products["unit_price"]))
-    customer_ids = customers["customer_id"].tolist()
-    store_ids = stores["store_id"].tolist()
-
-    payment_methods = ["Credit Card", "Debit Card", "Cash", "Digital Wallet"]
-    payment_weights = [0.45, 0.25, 0.15, 0.15]
-
+) -> Iterator[pd.DataFrame]:
+    """Generate sales transactions with realistic patterns, one shard at a time."""
     end_date = datetime.now()
     start_date = end_date - timedelta(days=DATE_RANGE_DAYS)
 
-    transactions = []
-    for i in range(1, NUM_TRANSACTIONS + 1):
-        product_id = random.choice(product_ids)
-        unit_price = product_prices[product_id]
-        quantity = random.choices(
-            [1, 2, 3, 4, 5],
-            weights=[0.50, 0.25, 0.15, 0.07, 0.03]
-        )[0]
-
-        # Apply discount based on quantity
-        discount_pct = 0.0
-        if quantity >= 3:
-            discount_pct = random.choice([0.05, 0.10, 0.15])
-
-        transaction_date = fake.date_time_between(
-            start_date=start_date,
-            end_date=end_date
-        )
-
-        transactions.append({
-            "transaction_id": f"TXN{i:010d}",
-            "transaction_date": transaction_date,
-            "customer_id": random.choice(customer_ids),
-            "product_id": product_id,
-            "store_id": random.choice(store_ids),
-            "quantity": quantity,
-            "unit_price": unit_price,
-            "discount_pct": discount_pct,
-            "total_amount": round(quantity * unit_price * (1 - discount_pct), 2),
-            "payment_method": random.choices(payment_methods, weights=payment_weights)[0],
-            "is_returned": random.choices([False, True], weights=[0.97, 0.03])[0],
-        })
-
-    return pd.DataFrame(transactions)
+    generate_shard = partial(
+        generate_transaction_shard,
+        product_ids=products["product_id"].to_numpy(),
+        unit_prices=products["unit_price"].to_numpy(),
+        customer_ids=customers["customer_id"].to_numpy(),
+        store_ids=stores["store_id"].to_numpy(),
+        start_date=start_date,
+        end_date=end_date,
+    )
+
+    # Shards draw from independent seeds and own disjoint ID ranges, so they
+    # can run in any process
+    first_ids = list(range(1, NUM_TRANSACTIONS + 1, TRANSACTION_SHARD_SIZE))
+    sizes = [min(TRANSACTION_SHARD_SIZE, NUM_TRANSACTIONS + 1 - first_id) for first_id in first_ids]
+    seeds = rng.integers(0, 2**63, len(first_ids))
+
+    if len(first_ids) <= 1:
+        yield from map(generate_shard, first_ids, sizes, seeds)
+        return
+
+    # Shards are yielded in order; capping the ones in flight keeps finished
+    # shards from piling up while the caller writes
+    workers = os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for args in zip(first_ids, sizes, seeds):
+            pending.append(pool.submit(generate_shard, *args))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def write_month_partitions(
+    frames: Iterable[pd.DataFrame],
+    path: Path,
+    schema: pa.Schema,
+    month_column: str
+) -> int:
+    """Stream frames into a hive-partitioned Parquet directory, one partition per month."""
+    rows = 0
+
+    def batches() -> Iterator[pa.RecordBatch]:
+        nonlocal rows
+        for df in frames:
+            table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+            table = table.append_column(PARTITION_COLUMN, pc.strftime(table[month_column], "%Y%m"))
+            rows += len(df)
+            yield from table.to_batches()
+
+    ds.write_dataset(
+        batches(),
+        path,
+        schema=schema.append(pa.field(PARTITION_COLUMN, pa.string())),
+        format="parquet",
+        partitioning=[PARTITION_COLUMN],
+        partitioning_flavor="hive",
+        file_options=ds.ParquetFileFormat().make_write_options(
+            compression=PARQUET_COMPRESSION, compression_level=PARQUET_COMPRESSION_LEVEL
+        ),
+        max_rows_per_group=PARQUET_ROW_GROUP_SIZE,
+    )
+    return rows
+
+
+def save_dataset(frames: Iterable[pd.DataFrame], table_name: str, output_format: str) -> int:
+    """Write a dataset as raw CSV, or as typed Parquet ready for analytics.
+
+    Frames are written as they arrive, so only one is held in memory at a
+    time. Returns the number of rows written.
+    """
+    rows = 0
+    if output_format == "parquet":
+        # Same column types transform.py would cast the CSV to
+        schema = pa.schema([
+            (col, pa.dictionary(pa.int32(), pa.string()) if col in DICTIONARY_COLUMNS else ARROW_TYPES[dtype])
+            for col, dtype in SCHEMAS[table_name].items()
+        ])
+        path = parquet_output(table_name)
+        if table_name in MONTH_PARTITIONS:
+            return write_month_partitions(frames, path, schema, MONTH_PARTITIONS[table_name])
+        with pq.ParquetWriter(
+            path, schema, compression=PARQUET_COMPRESSION, compression_level=PARQUET_COMPRESSION_LEVEL
+        ) as writer:
+            for df in frames:
+                table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+                writer.write_table(table, row_group_size=PARQUET_ROW_GROUP_SIZE)
+                rows += len(df)
+    else:
+        # Arrow formats the CSV in C++ rather than cell by cell like to_csv
+        schema = pa.schema([(col, ARROW_TYPES[dtype]) for col, dtype in SCHEMAS[table_name].items()])
+        path = OUTPUT_DIR / f"{table_name}.csv"
+        with pacsv.CSVWriter(path, schema) as writer:
+            for df in frames:
+                writer.write_table(pa.Table.from_pandas(df, schema=schema, preserve_index=False))
+                rows += len(df)
+    return rows
 
 
 def main():
-    """Generate all datasets and save to CSV."""
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    """Generate all datasets and save them as CSV or Parquet."""
+    parser = argparse.ArgumentParser(description="Generate synthetic retail data")
+    parser.add_argument(
+        "--format",
+        choices=["csv", "parquet"],
+        default="csv",
+        help="csv writes raw files for transform.py; parquet writes analytics-ready files directly"
+    )
+    args = parser.parse_args()
+
+    output_dir = PROCESSED_DIR if args.format == "parquet" else OUTPUT_DIR
+    output_dir.mkdir(parents=True, exist_ok=True)
 
     print("Generating products...")
     products = generate_products()
-    products.to_csv(OUTPUT_DIR / "products.csv", index=False)
+    save_dataset([products], "products", args.format)
     print(f"  Created {len(products)} products")
 
     print("Generating customers...")
     customers = generate_customers()
-    customers.to_csv(OUTPUT_DIR / "customers.csv", index=False)
+    save_dataset([customers], "customers", args.format)
     print(f"  Created {len(customers)} customers")
 
     print("Generating stores...")
     stores = generate_stores()
-    stores.to_csv(OUTPUT_DIR / "stores.csv", index=False)
+    save_dataset([stores], "stores", args.format)
     print(f"  Created {len(stores)} stores")
 
     print("Generating transactions...")
     transactions = generate_transactions(products, customers, stores)
-    transactions.to_csv(OUTPUT_DIR / "transactions.csv", index=False)
-    print(f"  Created {len(transactions)} transactions")
+    transaction_count = save_dataset(transactions, "transactions", args.format)
+    print(f"  Created {transaction_count} transactions")
 
-    print(f"\nAll files saved to: {OUTPUT_DIR}")
+    print(f"\nAll files saved to: {output_dir}")
 
 
 if __name__ == "__main__":
@@ -5,29 +5,23 @@ Provides an interactive SQL environment for ad-hoc queries
 against the retail analytics dataset.
 """
 
-from pathlib import Path
-
 import duckdb
 
-DATA_DIR = Path(__file__).parent.parent / "data" / "processed"
+from transform import register_views
+
+# Rows printed per query; only one more than this is fetched to detect truncation
+MAX_DISPLAY_ROWS = 100
 
 
 def create_connection() -> duckdb.DuckDBPyConnection:
     """Create DuckDB connection with Parquet files registered as views."""
-    conn = duckdb.connect()
+    # Parquet metadata is cached across the queries of a session
+    conn = duckdb.connect(config={"enable_object_cache": True})
 
-    parquet_files = list(DATA_DIR.glob("*.parquet"))
-
-    if not parquet_files:
+    table_names = register_views(conn)
+    if not table_names:
         print("No Parquet files found. Run 'make transform' first.")
-        return conn
-
-    for parquet_file in parquet_files:
-        table_name = parquet_file.stem
-        conn.execute(f"""
-            CREATE VIEW {table_name} AS 
-            SELECT * FROM read_parquet('{parquet_file}')
-        """)
+    for table_name in table_names:
         print(f"Registered view: {table_name}")
 
     return conn
@@ -45,6 +39,7 @@ Available Tables:
 Commands:
   .tables         : List all tables
   .schema TABLE   : Show table schema
+  .count          : Count the rows of the last query
   .quit           : Exit shell
   .help           : Show this help
 
@@ -66,6 +61,8 @@ def run_shell():
     conn = create_connection()
     print()
 
+    last_query = None
+
     while True:
         try:
             query = input("duckdb> ").strip()
@@ -104,8 +101,19 @@ def run_shell():
                 print()
                 continue
 
+            if query.lower() == ".count":
+                if last_query is None:
+                    print("No query to count yet")
+                    continue
+                count = conn.execute(
+                    f"SELECT COUNT(*) FROM ({last_query.rstrip(';')})"
+                ).fetchone()[0]
+                print(f"({count} rows)")
+                continue
+
             # Execute SQL query
             result = conn.execute(query)
+            last_query = query
             columns = [desc[0] for desc in result.description]
 
             # Print header
@@ -113,15 +121,16 @@ def run_shell():
             print(header)
             print("-" * len(header))
 
-            # Print rows
-            rows = result.fetchall()
-            for row in rows[:100]:  # Limit output
+            # Print rows, fetching only what is displayed
+            rows = result.fetchmany(MAX_DISPLAY_ROWS + 1)
+            for row in rows[:MAX_DISPLAY_ROWS]:
                 print(" | ".join(f"{str(v):15}" for v in row))
 
-            if len(rows) > 100:
-                print(f"... ({len(rows) - 100} more rows)")
-
-            print(f"\n({len(rows)} rows)")
+            if len(rows) > MAX_DISPLAY_ROWS:
+                print("... (more rows, use LIMIT or .count)")
+                print(f"\n({MAX_DISPLAY_ROWS}+ rows)")
+            else:
+                print(f"\n({len(rows)} rows)")
 
         except KeyboardInterrupt:
             print("\nUse '.quit' to exit")
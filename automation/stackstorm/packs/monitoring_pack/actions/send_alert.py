@@ -6,11 +6,22 @@ from st2common.runners.base_action import Action
 
 
 class SendAlertAction(Action):
-    def run(self, message, severity="medium", channel="email"):
+    CHANNELS = ("email", "slack", "webhook")
+    SEVERITIES = ("low", "medium", "high", "critical")
+    
+    def run(self, message=None, severity="medium", channel="email", alerts=None):
         """
         Send alert notification through specified channel
+        
+        When alerts (a list of message/severity/channel dicts) is given, they
+        are sent as a batch with one notification per channel instead.
         """
-        timestamp = datetime.now().isoformat()
+        if alerts:
+            return self.run_batch(alerts)
+        if not message:
+            return (False, "Either message or alerts is required")
+        
+        timestamp = datetime.now().isoformat(timespec='seconds')
         
         alert_data = {
             'timestamp': timestamp,
@@ -29,6 +40,47 @@ class SendAlertAction(Action):
         else:
             return (False, f"Unknown channel: {channel}")
     
+    def run_batch(self, alerts):
+        """
+        Send several alerts, grouped into a single notification per channel
+        """
+        # One timestamp for the whole batch rather than one per alert
+        timestamp = datetime.now().isoformat(timespec='seconds')
+        
+        batches = {}
+        for alert in alerts:
+            if not alert.get('message'):
+                return (False, "Alert missing message")
+            severity = alert.get('severity', 'medium')
+            if severity not in self.SEVERITIES:
+                return (False, f"Unknown severity: {severity}")
+            channel = alert.get('channel', 'email')
+            if channel not in self.CHANNELS:
+                return (False, f"Unknown channel: {channel}")
+            batches.setdefault(channel, []).append({
+                'timestamp': timestamp,
+                'message': alert['message'],
+                'severity': severity,
+                'channel': channel
+            })
+        
+        results = [self._send_batch_alert(channel, batch) for channel, batch in batches.items()]
+        return (True, {
+            'status': 'sent',
+            'alert_count': len(alerts),
+            'batches': results
+        })
+    
+    def _send_batch_alert(self, channel, batch):
+        """Send every alert for one channel in a single notification"""
+        summary = "\n".join(f"  [{alert['severity']}] {alert['message']}" for alert in batch)
+        self.logger.info(f"{channel.upper()} ALERT BATCH ({len(batch)} alerts):\n{summary}")
+        return {
+            'channel': channel,
+            'message': f"{len(batch)} alerts sent in one {channel} notification",
+            'payload': {'alerts': batch}
+        }
+    
     def _send_email_alert(self, alert_data):
         """Send email alert"""
         self.logger.info(f"EMAIL ALERT: {alert_data['message']}")
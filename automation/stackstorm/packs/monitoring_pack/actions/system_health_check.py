@@ -1,8 +1,17 @@
 #!/usr/bin/env python3
 
+import time
+
 import psutil
 from st2common.runners.base_action import Action
 
+# cpu_percent(interval=None) reports usage since the previous call, so prime
+# it at import and only wait out what is left of a short sample window
+# instead of blocking for a full second
+MIN_CPU_SAMPLE_SECONDS = 0.1
+psutil.cpu_percent(interval=None)
+_cpu_sample_start = time.monotonic()
+
 
 class SystemHealthCheckAction(Action):
     def run(self, threshold_cpu=80, threshold_memory=85, threshold_disk=90):
@@ -16,7 +25,10 @@ class SystemHealthCheckAction(Action):
         }
         
         # Check CPU usage
-        cpu_percent = psutil.cpu_percent(interval=1)
+        remaining = MIN_CPU_SAMPLE_SECONDS - (time.monotonic() - _cpu_sample_start)
+        if remaining > 0:
+            time.sleep(remaining)
+        cpu_percent = psutil.cpu_percent(interval=None)
         result['metrics']['cpu_usage'] = cpu_percent
         
         if cpu_percent > threshold_cpu:
@@ -5,24 +5,90 @@ import time
 from datetime import datetime
 from st2reactor.sensor.base import Sensor
 
+try:
+    from inotify_simple import INotify, flags
+except ImportError:  # non-Linux hosts fall back to polling
+    INotify = None
+
 
 class FileWatchSensor(Sensor):
     def __init__(self, sensor_service, config=None):
         super(FileWatchSensor, self).__init__(sensor_service=sensor_service, config=config)
         self._logger = self._sensor_service.get_logger(__name__)
         self._watch_file = "/tmp/monitored_file.txt"
+        self._watch_dir, self._watch_name = os.path.split(self._watch_file)
         self._last_modified = None
+        self._inotify = None
         
     def setup(self):
         """Setup the sensor"""
         self._logger.info("FileWatchSensor: Setting up file monitoring")
         if os.path.exists(self._watch_file):
             self._last_modified = os.path.getmtime(self._watch_file)
+        
+        if INotify is not None:
+            try:
+                # Watch the parent directory so deletes and atomic replaces are seen too
+                self._inotify = INotify()
+                self._inotify.add_watch(
+                    self._watch_dir,
+                    flags.CREATE | flags.CLOSE_WRITE | flags.DELETE | flags.MOVED_TO | flags.MOVED_FROM
+                )
+            except OSError as e:
+                # e.g. watch limit reached or a filesystem without inotify support
+                self._logger.warning(f"FileWatchSensor: inotify unavailable, polling instead: {str(e)}")
+                if self._inotify is not None:
+                    self._inotify.close()
+                    self._inotify = None
     
     def run(self):
         """Main sensor loop"""
         self._logger.info(f"FileWatchSensor: Starting to monitor {self._watch_file}")
         
+        if self._inotify is not None:
+            self._watch_events()
+        else:
+            self._poll()
+    
+    def _watch_events(self):
+        """Block on inotify events for the watched file"""
+        removed = flags.DELETE | flags.MOVED_FROM
+        # A new file shows up as CREATE and then the CLOSE_WRITE that finishes
+        # writing it; like polling, that only sets the baseline
+        created = False
+        
+        while True:
+            try:
+                for event in self._inotify.read():
+                    if event.name != self._watch_name:
+                        continue
+                    
+                    if event.mask & flags.CREATE:
+                        created = True
+                        self._last_modified = time.time()
+                    elif event.mask & flags.CLOSE_WRITE:
+                        if created:
+                            created = False
+                        elif self._last_modified is not None:
+                            self._trigger_file_changed("modified")
+                        self._last_modified = time.time()
+                    elif event.mask & flags.MOVED_TO:
+                        # Renamed into place fully written: a change only if it
+                        # replaced a file we already knew, as polling would see
+                        if self._last_modified is not None:
+                            self._trigger_file_changed("modified")
+                        self._last_modified = time.time()
+                    elif event.mask & removed and self._last_modified is not None:
+                        created = False
+                        self._trigger_file_changed("deleted")
+                        self._last_modified = None
+                
+            except Exception as e:
+                self._logger.error(f"FileWatchSensor error: {str(e)}")
+                time.sleep(10)
+    
+    def _poll(self):
+        """Check the file's mtime every 5 seconds"""
         while True:
             try:
                 if os.path.exists(self._watch_file):
@@ -49,6 +115,9 @@ class FileWatchSensor(Sensor):
     def cleanup(self):
         """Cleanup the sensor"""
         self._logger.info("FileWatchSensor: Cleaning up")
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
     
     def add_trigger(self, trigger):
         """Add trigger"""
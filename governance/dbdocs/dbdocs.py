@@ -6,6 +6,8 @@ Extracts schema information and generates Markdown documentation.
 """
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -13,7 +15,6 @@ from typing import Optional
 
 import psycopg2
 import typer
-from jinja2 import Template
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
@@ -21,7 +22,7 @@ app = typer.Typer(help="Generate documentation from PostgreSQL database schemas.
 console = Console()
 
 
-@dataclass
+@dataclass(slots=True)
 class Column:
     """Represents a database column."""
     name: str
@@ -32,7 +33,7 @@ class Column:
     comment: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ForeignKey:
     """Represents a foreign key relationship."""
     column: str
@@ -40,7 +41,7 @@ class ForeignKey:
     references_column: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Index:
     """Represents a database index."""
     name: str
@@ -48,7 +49,7 @@ class Index:
     is_unique: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class Table:
     """Represents a database table with its metadata."""
     name: str
@@ -60,21 +61,49 @@ class Table:
     sample_data: list[dict] = field(default_factory=list)
 
 
+@dataclass(slots=True)
+class SchemaMetadata:
+    """Per-table metadata for a whole schema, keyed by table name."""
+    columns: dict[str, list[Column]]
+    foreign_keys: dict[str, list[ForeignKey]]
+    indexes: dict[str, list[Index]]
+    comments: dict[str, str]
+
+
 class SchemaExtractor:
     """Extracts schema information from PostgreSQL database."""
 
     def __init__(self, connection_params: dict):
         self.conn_params = connection_params
-        self.conn = None
+        # psycopg2 connections must not be shared across threads, so each
+        # worker thread lazily opens its own
+        self._local = threading.local()
+        self._connections: list = []
+        self._lock = threading.Lock()
+        self._metadata: dict[str, SchemaMetadata] = {}
+        self._metadata_lock = threading.Lock()
+
+    @property
+    def conn(self):
+        """Database connection owned by the calling thread."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = psycopg2.connect(**self.conn_params)
+            with self._lock:
+                self._connections.append(conn)
+        return conn
 
     def connect(self) -> None:
         """Establish database connection."""
-        self.conn = psycopg2.connect(**self.conn_params)
+        self.conn
 
     def close(self) -> None:
-        """Close database connection."""
-        if self.conn:
-            self.conn.close()
+        """Close all database connections."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
 
     def get_tables(self, schema: str = "public") -> list[str]:
         """Retrieve list of tables in the specified schema."""
@@ -89,10 +118,11 @@ class SchemaExtractor:
             cur.execute(query, (schema,))
             return [row[0] for row in cur.fetchall()]
 
-    def get_columns(self, table: str, schema: str = "public") -> list[Column]:
-        """Retrieve column information for a table."""
+    def get_all_columns(self, schema: str = "public") -> dict[str, list[Column]]:
+        """Retrieve column information for every table in a schema."""
         query = """
             SELECT 
+                c.table_name,
                 c.column_name,
                 c.data_type,
                 c.is_nullable,
@@ -101,67 +131,73 @@ class SchemaExtractor:
                 pgd.description
             FROM information_schema.columns c
             LEFT JOIN (
-                SELECT ku.column_name
+                SELECT ku.table_name, ku.column_name
                 FROM information_schema.table_constraints tc
                 JOIN information_schema.key_column_usage ku
-                    ON tc.constraint_name = ku.constraint_name
+                    ON tc.constraint_schema = ku.constraint_schema
+                    AND tc.constraint_name = ku.constraint_name
                 WHERE tc.constraint_type = 'PRIMARY KEY'
-                AND tc.table_name = %s
                 AND tc.table_schema = %s
-            ) pk ON c.column_name = pk.column_name
+            ) pk ON c.table_name = pk.table_name AND c.column_name = pk.column_name
             LEFT JOIN pg_catalog.pg_statio_all_tables st
                 ON st.schemaname = c.table_schema AND st.relname = c.table_name
             LEFT JOIN pg_catalog.pg_description pgd
                 ON pgd.objoid = st.relid AND pgd.objsubid = c.ordinal_position
-            WHERE c.table_name = %s
-            AND c.table_schema = %s
-            ORDER BY c.ordinal_position
+            WHERE c.table_schema = %s
+            ORDER BY c.table_name, c.ordinal_position
         """
+        columns: dict[str, list[Column]] = {}
         with self.conn.cursor() as cur:
-            cur.execute(query, (table, schema, table, schema))
-            return [
-                Column(
-                    name=row[0],
-                    data_type=row[1],
-                    nullable=row[2] == "YES",
-                    default=row[3],
-                    is_primary_key=row[4],
-                    comment=row[5],
+            cur.execute(query, (schema, schema))
+            for row in cur.fetchall():
+                columns.setdefault(row[0], []).append(
+                    Column(
+                        name=row[1],
+                        data_type=row[2],
+                        nullable=row[3] == "YES",
+                        default=row[4],
+                        is_primary_key=row[5],
+                        comment=row[6],
+                    )
                 )
-                for row in cur.fetchall()
-            ]
+        return columns
 
-    def get_foreign_keys(self, table: str, schema: str = "public") -> list[ForeignKey]:
-        """Retrieve foreign key relationships for a table."""
+    def get_all_foreign_keys(self, schema: str = "public") -> dict[str, list[ForeignKey]]:
+        """Retrieve foreign key relationships for every table in a schema."""
         query = """
             SELECT
+                tc.table_name,
                 kcu.column_name,
                 ccu.table_name AS references_table,
                 ccu.column_name AS references_column
             FROM information_schema.table_constraints tc
             JOIN information_schema.key_column_usage kcu
-                ON tc.constraint_name = kcu.constraint_name
+                ON tc.constraint_schema = kcu.constraint_schema
+                AND tc.constraint_name = kcu.constraint_name
             JOIN information_schema.constraint_column_usage ccu
-                ON ccu.constraint_name = tc.constraint_name
+                ON ccu.constraint_schema = tc.constraint_schema
+                AND ccu.constraint_name = tc.constraint_name
             WHERE tc.constraint_type = 'FOREIGN KEY'
-            AND tc.table_name = %s
             AND tc.table_schema = %s
         """
+        foreign_keys: dict[str, list[ForeignKey]] = {}
         with self.conn.cursor() as cur:
-            cur.execute(query, (table, schema))
-            return [
-                ForeignKey(
-                    column=row[0],
-                    references_table=row[1],
-                    references_column=row[2],
+            cur.execute(query, (schema,))
+            for row in cur.fetchall():
+                foreign_keys.setdefault(row[0], []).append(
+                    ForeignKey(
+                        column=row[1],
+                        references_table=row[2],
+                        references_column=row[3],
+                    )
                 )
-                for row in cur.fetchall()
-            ]
+        return foreign_keys
 
-    def get_indexes(self, table: str, schema: str = "public") -> list[Index]:
-        """Retrieve index information for a table."""
+    def get_all_indexes(self, schema: str = "public") -> dict[str, list[Index]]:
+        """Retrieve index information for every table in a schema."""
         query = """
             SELECT
+                t.relname as table_name,
                 i.relname as index_name,
                 array_agg(a.attname ORDER BY array_position(ix.indkey, a.attnum)) as columns,
                 ix.indisunique as is_unique
@@ -170,36 +206,68 @@ class SchemaExtractor:
             JOIN pg_class i ON i.oid = ix.indexrelid
             JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = ANY(ix.indkey)
             JOIN pg_namespace n ON n.oid = t.relnamespace
-            WHERE t.relname = %s
-            AND n.nspname = %s
+            WHERE n.nspname = %s
             AND NOT ix.indisprimary
-            GROUP BY i.relname, ix.indisunique
+            GROUP BY t.relname, i.relname, ix.indisunique
         """
+        indexes: dict[str, list[Index]] = {}
         with self.conn.cursor() as cur:
-            cur.execute(query, (table, schema))
-            return [
-                Index(name=row[0], columns=row[1], is_unique=row[2])
-                for row in cur.fetchall()
-            ]
+            cur.execute(query, (schema,))
+            for row in cur.fetchall():
+                indexes.setdefault(row[0], []).append(
+                    Index(name=row[1], columns=row[2], is_unique=row[3])
+                )
+        return indexes
 
-    def get_table_comment(self, table: str, schema: str = "public") -> Optional[str]:
-        """Retrieve table comment if exists."""
+    def get_all_table_comments(self, schema: str = "public") -> dict[str, str]:
+        """Retrieve comments for every commented table in a schema."""
         query = """
-            SELECT obj_description(
-                (quote_ident(%s) || '.' || quote_ident(%s))::regclass, 'pg_class'
-            )
+            SELECT c.relname, obj_description(c.oid, 'pg_class')
+            FROM pg_class c
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE n.nspname = %s
+            AND c.relkind IN ('r', 'p')
+            AND obj_description(c.oid, 'pg_class') IS NOT NULL
         """
         with self.conn.cursor() as cur:
-            cur.execute(query, (schema, table))
-            result = cur.fetchone()
-            return result[0] if result else None
+            cur.execute(query, (schema,))
+            return dict(cur.fetchall())
+
+    def get_metadata(self, schema: str = "public") -> SchemaMetadata:
+        """Fetch metadata for all tables in a schema once and reuse it."""
+        with self._metadata_lock:
+            metadata = self._metadata.get(schema)
+            if metadata is None:
+                metadata = self._metadata[schema] = SchemaMetadata(
+                    columns=self.get_all_columns(schema),
+                    foreign_keys=self.get_all_foreign_keys(schema),
+                    indexes=self.get_all_indexes(schema),
+                    comments=self.get_all_table_comments(schema),
+                )
+        return metadata
+
+    def get_columns(self, table: str, schema: str = "public") -> list[Column]:
+        """Retrieve column information for a table."""
+        return self.get_metadata(schema).columns.get(table, [])
+
+    def get_foreign_keys(self, table: str, schema: str = "public") -> list[ForeignKey]:
+        """Retrieve foreign key relationships for a table."""
+        return self.get_metadata(schema).foreign_keys.get(table, [])
+
+    def get_indexes(self, table: str, schema: str = "public") -> list[Index]:
+        """Retrieve index information for a table."""
+        return self.get_metadata(schema).indexes.get(table, [])
+
+    def get_table_comment(self, table: str, schema: str = "public") -> Optional[str]:
+        """Retrieve table comment if exists."""
+        return self.get_metadata(schema).comments.get(table)
 
     def get_sample_data(self, table: str, schema: str = "public", limit: int = 5) -> list[dict]:
         """Retrieve sample rows from a table."""
         query = f'SELECT * FROM "{schema}"."{table}" LIMIT %s'
         with self.conn.cursor() as cur:
             cur.execute(query, (limit,))
-            columns = [desc[0] for desc in cur.description]
+            columns = tuple(desc[0] for desc in cur.description)
             return [dict(zip(columns, row)) for row in cur.fetchall()]
 
     def extract_table(self, table_name: str, schema: str = "public", include_samples: bool = False) -> Table:
@@ -225,90 +293,88 @@ class SchemaExtractor:
 class DocumentGenerator:
     """Generates Markdown documentation from schema metadata."""
 
-    TEMPLATE = """# Database Documentation
-
-**Database:** {{ database }}  
-**Generated:** {{ timestamp }}  
-**Tables:** {{ tables | length }}
-
----
-
-## Overview
-
-| Table | Columns | Description |
-|-------|---------|-------------|
-{% for table in tables -%}
-| [{{ table.name }}](#{{ table.name }}) | {{ table.columns | length }} | {{ table.comment or '-' }} |
-{% endfor %}
-
----
-
-{% for table in tables %}
-## {{ table.name }}
-
-{% if table.comment %}
-{{ table.comment }}
-{% endif %}
-
-### Columns
-
-| Column | Type | Nullable | Default | Key | Description |
-|--------|------|----------|---------|-----|-------------|
-{% for col in table.columns -%}
-| {{ col.name }} | `{{ col.data_type }}` | {{ 'Yes' if col.nullable else 'No' }} | {{ col.default or '-' }} | {{ 'PK' if col.is_primary_key else '' }} | {{ col.comment or '-' }} |
-{% endfor %}
-
-{% if table.foreign_keys %}
-### Foreign Keys
-
-| Column | References |
-|--------|------------|
-{% for fk in table.foreign_keys -%}
-| {{ fk.column }} | {{ fk.references_table }}.{{ fk.references_column }} |
-{% endfor %}
-{% endif %}
-
-{% if table.indexes %}
-### Indexes
-
-| Name | Columns | Unique |
-|------|---------|--------|
-{% for idx in table.indexes -%}
-| {{ idx.name }} | {{ idx.columns | join(', ') }} | {{ 'Yes' if idx.is_unique else 'No' }} |
-{% endfor %}
-{% endif %}
-
-{% if table.sample_data %}
-### Sample Data
-
-| {% for col in table.columns %}{{ col.name }} | {% endfor %}
-
-|{% for col in table.columns %} --- |{% endfor %}
-
-{% for row in table.sample_data -%}
-| {% for col in table.columns %}{{ row[col.name] | default('-', true) }} | {% endfor %}
-
-{% endfor %}
-{% endif %}
-
----
-
-{% endfor %}
-"""
-
     def __init__(self, database: str, tables: list[Table]):
         self.database = database
         self.tables = tables
 
     def render(self) -> str:
         """Render the documentation as Markdown."""
-        template = Template(self.TEMPLATE)
-        return template.render(
-            database=self.database,
-            timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            tables=self.tables,
+        lines = [
+            "# Database Documentation",
+            "",
+            f"**Database:** {self.database}  ",
+            f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  ",
+            f"**Tables:** {len(self.tables)}",
+            "",
+            "---",
+            "",
+            "## Overview",
+            "",
+            "| Table | Columns | Description |",
+            "|-------|---------|-------------|",
+        ]
+        lines.extend(
+            f"| [{table.name}](#{table.name}) | {len(table.columns)} | {table.comment or '-'} |"
+            for table in self.tables
+        )
+        lines.extend(["", "---"])
+
+        for table in self.tables:
+            lines.extend(self._render_table(table))
+            lines.extend(["", "---"])
+
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _render_table(table: Table) -> list[str]:
+        """Render the section for a single table."""
+        lines = ["", f"## {table.name}"]
+        if table.comment:
+            lines.extend(["", table.comment])
+
+        lines.extend([
+            "",
+            "### Columns",
+            "",
+            "| Column | Type | Nullable | Default | Key | Description |",
+            "|--------|------|----------|---------|-----|-------------|",
+        ])
+        lines.extend(
+            f"| {col.name} | `{col.data_type}` | {'Yes' if col.nullable else 'No'} | "
+            f"{col.default or '-'} | {'PK' if col.is_primary_key else ''} | {col.comment or '-'} |"
+            for col in table.columns
         )
 
+        if table.foreign_keys:
+            lines.extend(["", "### Foreign Keys", "", "| Column | References |", "|--------|------------|"])
+            lines.extend(
+                f"| {fk.column} | {fk.references_table}.{fk.references_column} |"
+                for fk in table.foreign_keys
+            )
+
+        if table.indexes:
+            lines.extend(["", "### Indexes", "", "| Name | Columns | Unique |", "|------|---------|--------|"])
+            lines.extend(
+                f"| {idx.name} | {', '.join(idx.columns)} | {'Yes' if idx.is_unique else 'No'} |"
+                for idx in table.indexes
+            )
+
+        if table.sample_data:
+            names = [col.name for col in table.columns]
+            lines.extend([
+                "",
+                "### Sample Data",
+                "",
+                "| " + " | ".join(names) + " |",
+                "|" + " --- |" * len(names),
+            ])
+            lines.extend(
+                "| " + " | ".join("-" if row[name] is None else str(row[name]) for name in names) + " |"
+                for row in table.sample_data
+            )
+
+        return lines
+
 
 @app.command()
 def main(
@@ -320,6 +386,7 @@ def main(
     schema: str = typer.Option("public", "--schema", "-s", help="Schema to document"),
     output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output file path"),
     samples: bool = typer.Option(False, "--samples", help="Include sample data"),
+    workers: int = typer.Option(8, "--workers", "-w", min=1, help="Concurrent connections used for extraction"),
 ):
     """
     Generate Markdown documentation from PostgreSQL database schema.
@@ -360,9 +427,12 @@ def main(
                 extractor.close()
                 return
 
-            tables = []
-            for table_name in table_names:
-                tables.append(extractor.extract_table(table_name, schema, samples))
+            # Extraction is round-trip bound, so tables are fetched concurrently
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                tables = list(pool.map(
+                    lambda table_name: extractor.extract_table(table_name, schema, samples),
+                    table_names,
+                ))
 
             progress.add_task("Generating documentation...", total=None)
             generator = DocumentGenerator(database, tables)
@@ -2,9 +2,13 @@
 """
 Data Quality Profiler - Data quality analysis with HTML reports
 """
+import hashlib
 import json
+import os
 import re
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -12,13 +16,210 @@ from typing import Dict, List, Optional
 import numpy as np
 import pandas as pd
 import typer
-from jinja2 import Template
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
 from rich.console import Console
 from rich.table import Table
 
 app = typer.Typer(help="Data Quality Profiler - Data quality analysis tool")
 console = Console()
 
+# The Arrow CSV reader is multithreaded and much faster; fall back to the C parser without it
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
+
+EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+# Non-null values checked when guessing a text column's format
+FORMAT_SAMPLE_SIZE = 100
+
+
+# Templates are parsed once and their compiled bytecode is cached across
+# runs; the stylesheet is inlined so the report stays a single file
+BASE_DIR = Path(__file__).resolve().parent
+REPORT_CACHE_DIR = Path(tempfile.gettempdir()) / "data-quality-profiler"
+TEMPLATE_ENV = Environment(
+    loader=FileSystemLoader([BASE_DIR / "templates", BASE_DIR / "static"]),
+    autoescape=select_autoescape(["html"]),
+    auto_reload=False,
+    bytecode_cache=FileSystemBytecodeCache(),
+)
+HTML_TEMPLATE = TEMPLATE_ENV.get_template("report.html")
+
+
+class StreamingColumnStats:
+    """Running statistics for one column, updated one chunk at a time"""
+
+    # Bottom-k sizes: distinct hashes kept for the unique-count estimate and
+    # values kept for quartiles
+    DISTINCT_SKETCH_SIZE = 8192
+    QUANTILE_SAMPLE_SIZE = 10_000
+    FORMAT_SAMPLE_SIZE = FORMAT_SAMPLE_SIZE
+    # Spellings the C parser reads as booleans
+    BOOL_STRINGS = frozenset({"True", "TRUE", "true", "False", "FALSE", "false"})
+
+    def __init__(self):
+        self.total = 0
+        self.null_count = 0
+        self.dtype: Optional[np.dtype] = None
+        # Numeric moments, merged across chunks with Chan's parallel update
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        # Distinct sketch of the parsed numbers/booleans, or of the raw text
+        # once the column is text
+        self.hashes = np.empty(0, dtype=np.uint64)
+        # Set when a later chunk turned the column into text: the earlier
+        # chunks were only hashed as numbers and must be read again
+        self.needs_text_rescan = False
+        self.sample = np.empty(0, dtype=np.float64)
+        self.sample_keys = np.empty(0, dtype=np.float64)
+        self.format_values: List = []
+        self._rng = np.random.default_rng()
+
+    def update(self, series: pd.Series) -> None:
+        """Fold one chunk of the column, read as text, into the running statistics
+
+        The chunk's type is inferred here the way the C parser would for the
+        whole file, so a value hashes the same whichever chunk it is in.
+        """
+        self.total += len(series)
+        values = series.dropna()
+        has_nulls = len(values) < len(series)
+        self.null_count += len(series) - len(values)
+
+        if self.dtype != object:
+            # An all-null chunk parses as float64, like an int column with nulls
+            parsed = self._parse_number(values)
+            if parsed is not None:
+                chunk_dtype = np.dtype(np.float64) if has_nulls else parsed.dtype
+            elif not has_nulls and values.isin(self.BOOL_STRINGS).all():
+                chunk_dtype = np.dtype(bool)
+                parsed = values.str.lower().eq("true")
+            else:
+                chunk_dtype = np.dtype(object)
+
+            first_chunk = self.dtype is None
+            if first_chunk:
+                self.dtype = chunk_dtype
+            elif (self.dtype == bool) != (chunk_dtype == bool):
+                self.dtype = np.dtype(object)
+            else:
+                self.dtype = np.result_type(self.dtype, chunk_dtype)
+
+            if self.dtype != object:
+                # Hashed as float64 so int and float chunks agree on equal values
+                parsed = parsed.astype(np.float64)
+                self.hashes = self._merge_sketch(self.hashes, parsed)
+                if self.is_numeric:
+                    self._update_numeric(parsed.to_numpy())
+                return
+
+            self.hashes = np.empty(0, dtype=np.uint64)
+            self.needs_text_rescan = not first_chunk
+
+        self.add_text(values)
+
+    def add_text(self, values: pd.Series) -> None:
+        """Hash non-null raw text values and keep the first for format detection"""
+        if len(self.format_values) < self.FORMAT_SAMPLE_SIZE:
+            self.format_values.extend(values.head(self.FORMAT_SAMPLE_SIZE - len(self.format_values)))
+        self.hashes = self._merge_sketch(self.hashes, values)
+
+    def clear_text(self) -> None:
+        """Drop the text sketch and format sample before a rescan"""
+        self.hashes = np.empty(0, dtype=np.uint64)
+        self.format_values = []
+        self.needs_text_rescan = False
+
+    @property
+    def is_numeric(self) -> bool:
+        return self.dtype is not None and self.dtype != object and self.dtype != bool
+
+    @staticmethod
+    def _parse_number(values: pd.Series) -> Optional[pd.Series]:
+        """The values as int64, else float64, or None if any is not a number"""
+        # A plain cast fails fast on text and is much cheaper than to_numeric
+        for dtype in (np.int64, np.float64):
+            try:
+                return values.astype(dtype)
+            except (ValueError, OverflowError):
+                pass
+        return None
+
+    def _merge_sketch(self, sketch: np.ndarray, values: pd.Series) -> np.ndarray:
+        hashes = pd.util.hash_pandas_object(values, index=False).to_numpy()
+        return np.unique(np.concatenate([sketch, hashes]))[:self.DISTINCT_SKETCH_SIZE]
+
+    def _update_numeric(self, a: np.ndarray) -> None:
+        if len(a) == 0:
+            return
+
+        n = self.count + len(a)
+        chunk_mean = a.mean()
+        delta = chunk_mean - self.mean
+        self.m2 += ((a - chunk_mean) ** 2).sum() + delta ** 2 * self.count * len(a) / n
+        self.mean += delta * len(a) / n
+        self.count = n
+        self.min = min(self.min, a.min())
+        self.max = max(self.max, a.max())
+
+        # Keeping the values with the smallest random keys is a uniform sample
+        keys = np.concatenate([self.sample_keys, self._rng.random(len(a))])
+        sample = np.concatenate([self.sample, a])
+        if len(keys) > self.QUANTILE_SAMPLE_SIZE:
+            keep = np.argpartition(keys, self.QUANTILE_SAMPLE_SIZE)[:self.QUANTILE_SAMPLE_SIZE]
+            keys, sample = keys[keep], sample[keep]
+        self.sample_keys, self.sample = keys, sample
+
+    def unique_count(self) -> int:
+        """Distinct non-null values; estimated once the sketch is full"""
+        if len(self.hashes) < self.DISTINCT_SKETCH_SIZE:
+            return len(self.hashes)
+        kth = float(self.hashes[-1]) / 2.0 ** 64
+        return min(self.total - self.null_count, int((self.DISTINCT_SKETCH_SIZE - 1) / kth))
+
+    def format_sample(self) -> pd.Series:
+        """The first non-null values, for format detection"""
+        return pd.Series(self.format_values, dtype=object)
+
+    def summary(self, name: str) -> Dict:
+        """Column analysis in the same shape as analyze_column"""
+        unique_count = self.unique_count()
+        analysis = {
+            "name": name,
+            "dtype": str(self.dtype),
+            "total": self.total,
+            "null_count": self.null_count,
+            "null_pct": round(np.float64(self.null_count) / self.total * 100, 2),
+            "unique_count": unique_count,
+            "duplicate_count": self.total - unique_count,
+            "is_numeric": self.is_numeric,
+        }
+
+        if self.is_numeric:
+            has_values = self.count > 0
+            outliers_pct = 0.0
+            if has_values:
+                q1, median, q3 = np.quantile(self.sample, [0.25, 0.5, 0.75])
+                iqr = q3 - q1
+                outliers_pct = float(np.mean((self.sample < q1 - 1.5 * iqr) | (self.sample > q3 + 1.5 * iqr)))
+            outliers_count = int(round(outliers_pct * self.count))
+            analysis.update({
+                "min": float(self.min) if has_values else None,
+                "max": float(self.max) if has_values else None,
+                "mean": round(float(self.mean), 2) if has_values else None,
+                "median": round(float(median), 2) if has_values else None,
+                "std": round(float(np.sqrt(self.m2 / (self.count - 1))), 2) if self.count > 1 else None,
+                "outliers_count": outliers_count,
+                "outliers_pct": round(outliers_count / self.total * 100, 2),
+            })
+
+        return analysis
+
 
 class DataQualityProfiler:
     """Analyzes data quality and generates reports"""
@@ -27,13 +228,14 @@ class DataQualityProfiler:
         self.filepath = filepath
         self.df: Optional[pd.DataFrame] = None
         self.quality_report: Dict = {}
+        self._stats: Optional[Dict[str, pd.Series]] = None
 
     def load_data(self) -> pd.DataFrame:
         """Load data from file"""
         suffix = self.filepath.suffix.lower()
 
         if suffix == ".csv":
-            self.df = pd.read_csv(self.filepath)
+            self.df = pd.read_csv(self.filepath, engine=CSV_ENGINE)
         elif suffix == ".parquet":
             self.df = pd.read_parquet(self.filepath)
         elif suffix == ".json":
@@ -43,97 +245,196 @@ class DataQualityProfiler:
 
         return self.df
 
-    def detect_outliers(self, series: pd.Series) -> List[int]:
-        """Detect outliers using IQR method"""
-        if not pd.api.types.is_numeric_dtype(series):
-            return []
-
-        Q1 = series.quantile(0.25)
-        Q3 = series.quantile(0.75)
-        IQR = Q3 - Q1
-        lower_bound = Q1 - 1.5 * IQR
-        upper_bound = Q3 + 1.5 * IQR
-
-        outliers = series[(series < lower_bound) | (series > upper_bound)].index.tolist()
-        return outliers
-
-    def validate_email(self, value) -> bool:
-        """Validate email format"""
-        if pd.isna(value):
-            return True
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, str(value)))
-
-    def validate_date(self, value) -> bool:
-        """Validate date format"""
-        if pd.isna(value):
-            return True
-        try:
-            pd.to_datetime(value)
-            return True
-        except:
-            return False
+    def _compute_bulk_stats(self) -> Dict[str, pd.Series]:
+        """Compute per-column statistics for the whole DataFrame at once
+
+        Each entry is a Series indexed by column name, so analyze_column
+        only has to look values up instead of rescanning the column.
+        """
+        # Null percentages come from the counts; no second pass over the mask
+        null_count = self.df.isna().sum()
+        numeric = self.df.select_dtypes(include="number")
+        # describe() also yields the quartiles the IQR outlier rule needs; it
+        # refuses a frame with no columns, so stand in an empty one
+        if len(numeric.columns):
+            desc = numeric.describe()
+        else:
+            desc = pd.DataFrame(index=["min", "max", "mean", "50%", "std", "25%", "75%"], dtype=np.float64)
+        q1, q3 = desc.loc["25%"], desc.loc["75%"]
+        iqr = q3 - q1
+        # Count straight off the float buffer: the bounds are disjoint, so two
+        # counts replace building and OR-ing two boolean frames
+        values = numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+        lower = (q1 - 1.5 * iqr).to_numpy()
+        upper = (q3 + 1.5 * iqr).to_numpy()
+        outliers_count = np.count_nonzero(values < lower, axis=0) + np.count_nonzero(values > upper, axis=0)
+
+        return {
+            "null_count": null_count,
+            "null_pct": null_count / len(self.df) * 100,
+            "unique_count": self.df.nunique(),
+            "min": desc.loc["min"],
+            "max": desc.loc["max"],
+            "mean": desc.loc["mean"],
+            "median": desc.loc["50%"],
+            "std": desc.loc["std"],
+            "outliers_count": pd.Series(outliers_count, index=numeric.columns),
+        }
 
     def analyze_column(self, col: str) -> Dict:
         """Analyze quality of a column"""
+        if self._stats is None:
+            self._stats = self._compute_bulk_stats()
+        stats = self._stats
+
         series = self.df[col]
-        is_numeric = pd.api.types.is_numeric_dtype(series)
+        total = len(series)
+        null_count = int(stats["null_count"][col])
+        unique_count = int(stats["unique_count"][col])
+        is_numeric = col in stats["mean"].index
 
         analysis = {
             "name": col,
             "dtype": str(series.dtype),
-            "total": len(series),
-            "null_count": int(series.isna().sum()),
-            "null_pct": round(series.isna().mean() * 100, 2),
-            "unique_count": int(series.nunique()),
-            "duplicate_count": int(len(series) - series.nunique()),
+            "total": total,
+            "null_count": null_count,
+            "null_pct": round(stats["null_pct"][col], 2),
+            "unique_count": unique_count,
+            "duplicate_count": total - unique_count,
             "is_numeric": is_numeric,
         }
 
         # Numeric statistics
         if is_numeric:
+            all_null = null_count == total
+            outliers_count = int(stats["outliers_count"][col])
             analysis.update({
-                "min": float(series.min()) if not series.isna().all() else None,
-                "max": float(series.max()) if not series.isna().all() else None,
-                "mean": round(float(series.mean()), 2) if not series.isna().all() else None,
-                "median": round(float(series.median()), 2) if not series.isna().all() else None,
-                "std": round(float(series.std()), 2) if not series.isna().all() else None,
-                "outliers_count": len(self.detect_outliers(series)),
-                "outliers_pct": round(len(self.detect_outliers(series)) / len(series) * 100, 2),
+                "min": float(stats["min"][col]) if not all_null else None,
+                "max": float(stats["max"][col]) if not all_null else None,
+                "mean": round(float(stats["mean"][col]), 2) if not all_null else None,
+                "median": round(float(stats["median"][col]), 2) if not all_null else None,
+                "std": round(float(stats["std"][col]), 2) if not all_null else None,
+                "outliers_count": outliers_count,
+                "outliers_pct": round(outliers_count / total * 100, 2),
             })
 
         # Format validations
         if series.dtype == 'object':
-            # Try to detect emails
-            sample = series.dropna().head(100)
-            if len(sample) > 0:
-                email_count = sum(self.validate_email(v) for v in sample)
-                if email_count > len(sample) * 0.5:
-                    analysis["likely_email"] = True
-
-                date_count = sum(self.validate_date(v) for v in sample)
-                if date_count > len(sample) * 0.5:
-                    analysis["likely_date"] = True
-
-        # Quality score (0-100)
+            analysis.update(self._detect_formats(self._format_sample(series, total - null_count, unique_count)))
+        elif pd.api.types.is_datetime64_any_dtype(series):
+            # The Arrow reader already parsed ISO dates into timestamps
+            analysis["likely_date"] = True
+
+        analysis["quality_score"] = self._quality_score(analysis)
+
+        return analysis
+
+    @staticmethod
+    def _format_sample(series: pd.Series, non_null: int, unique_count: int) -> pd.Series:
+        """The first FORMAT_SAMPLE_SIZE non-null values, without copying the whole column"""
+        # Nothing to sample in an all-null column, and in a constant one any
+        # single value gives the same format ratio as the full sample
+        if non_null == 0:
+            return series.iloc[:0]
+        if unique_count == 1:
+            return series.iloc[[int(series.notna().to_numpy().argmax())]]
+
+        wanted = min(FORMAT_SAMPLE_SIZE, non_null)
+        sample = series.head(2 * FORMAT_SAMPLE_SIZE).dropna().head(wanted)
+        if len(sample) < wanted:
+            sample = series.dropna().head(wanted)
+        return sample
+
+    def _detect_formats(self, sample: pd.Series) -> Dict:
+        """Flag a column as likely email/date from a sample of its values"""
+        formats = {}
+        if len(sample) > 0:
+            # Low-cardinality columns repeat a few values, so check each distinct
+            # value once and weight the result by how often it occurs
+            counts = sample.value_counts()
+            distinct = counts.index.to_series(index=range(len(counts)))
+
+            # Match and parse the whole sample at once rather than value by value
+            email_count = counts[distinct.astype(str).str.match(EMAIL_RE).to_numpy()].sum()
+            if email_count > len(sample) * 0.5:
+                formats["likely_email"] = True
+
+            # format="mixed" parses each value on its own, like pd.to_datetime(value)
+            parsed = pd.to_datetime(distinct, errors="coerce", format="mixed")
+            date_count = counts[parsed.notna().to_numpy()].sum()
+            if date_count > len(sample) * 0.5:
+                formats["likely_date"] = True
+
+        return formats
+
+    @staticmethod
+    def _quality_score(analysis: Dict) -> float:
+        """Quality score (0-100) for an analyzed column"""
         quality_score = 100
         quality_score -= analysis["null_pct"] * 0.5  # Penalize nulls
         if analysis["duplicate_count"] > analysis["total"] * 0.5:
             quality_score -= 20  # Penalize many duplicates
-        if is_numeric and analysis.get("outliers_pct", 0) > 10:
+        if analysis["is_numeric"] and analysis.get("outliers_pct", 0) > 10:
             quality_score -= 10  # Penalize many outliers
 
-        analysis["quality_score"] = max(0, round(quality_score, 1))
-
-        return analysis
+        return max(0, round(quality_score, 1))
 
     def generate_report(self) -> Dict:
         """Generate complete quality report"""
         if self.df is None:
             self.load_data()
 
-        column_analyses = [self.analyze_column(col) for col in self.df.columns]
+        self._stats = self._compute_bulk_stats()
+        # Columns are analyzed independently; pandas drops the GIL for most of the work
+        with ThreadPoolExecutor() as executor:
+            column_analyses = list(executor.map(self.analyze_column, self.df.columns))
+
+        return self._build_report(column_analyses, len(self.df), len(self.df.columns))
 
+    def stream_report(self, chunksize: int = 100_000) -> Dict:
+        """Generate the quality report reading a CSV in chunks
+
+        Memory stays bounded by the chunk size, so files larger than RAM
+        can be profiled. Unique counts come from a distinct-value sketch
+        and quartiles/median/outliers from a uniform sample; both are
+        exact while a column's non-null values fit in them.
+        """
+        if self.filepath.suffix.lower() != ".csv":
+            raise ValueError("Streaming is only supported for CSV files")
+
+        columns: Dict[str, StreamingColumnStats] = {}
+        total_rows = 0
+        # Read as text: StreamingColumnStats infers each column's type across
+        # all chunks instead of trusting one chunk's guess
+        for chunk in pd.read_csv(self.filepath, chunksize=chunksize, dtype=str):
+            total_rows += len(chunk)
+            for col in chunk.columns:
+                if col not in columns:
+                    columns[col] = StreamingColumnStats()
+                columns[col].update(chunk[col])
+
+        # Columns that only turned to text in a later chunk are read once more
+        # on their own, so their earlier values are hashed as text too
+        rescan = [col for col, col_stats in columns.items() if col_stats.needs_text_rescan]
+        if rescan:
+            for col in rescan:
+                columns[col].clear_text()
+            for chunk in pd.read_csv(self.filepath, chunksize=chunksize, dtype=str, usecols=rescan):
+                for col in rescan:
+                    columns[col].add_text(chunk[col].dropna())
+
+        column_analyses = []
+        for col, col_stats in columns.items():
+            analysis = col_stats.summary(col)
+            if analysis["dtype"] == "object":
+                analysis.update(self._detect_formats(col_stats.format_sample()))
+            analysis["quality_score"] = self._quality_score(analysis)
+            column_analyses.append(analysis)
+
+        return self._build_report(column_analyses, total_rows, len(columns))
+
+    def _build_report(self, column_analyses: List[Dict], total_rows: int, total_columns: int) -> Dict:
+        """Collect issues and the overall score from the column analyses"""
         # Detect issues
         issues = []
         for col_analysis in column_analyses:
@@ -167,8 +468,8 @@ class DataQualityProfiler:
         self.quality_report = {
             "file": str(self.filepath.name),
             "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "total_rows": len(self.df),
-            "total_columns": len(self.df.columns),
+            "total_rows": total_rows,
+            "total_columns": total_columns,
             "overall_quality_score": round(avg_quality, 1),
             "columns": column_analyses,
             "issues": issues,
@@ -187,261 +488,45 @@ class DataQualityProfiler:
         if not self.quality_report:
             self.generate_report()
 
-        html_template = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Data Quality Report - {{ report.file }}</title>
-    <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
-            background: #f5f7fa;
-            color: #2c3e50;
-            line-height: 1.6;
-            padding: 20px;
-        }
-        .container { max-width: 1200px; margin: 0 auto; }
-        .header {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 30px;
-            border-radius: 10px;
-            margin-bottom: 30px;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }
-        .header h1 { font-size: 2.5em; margin-bottom: 10px; }
-        .header p { opacity: 0.9; font-size: 1.1em; }
-        .score-card {
-            background: white;
-            padding: 25px;
-            border-radius: 10px;
-            margin-bottom: 30px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-        .score-large {
-            font-size: 4em;
-            font-weight: bold;
-            color: #667eea;
-            text-align: center;
-            margin: 20px 0;
-        }
-        .summary-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            margin-bottom: 30px;
-        }
-        .summary-card {
-            background: white;
-            padding: 20px;
-            border-radius: 10px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            text-align: center;
-        }
-        .summary-card h3 {
-            color: #667eea;
-            font-size: 2em;
-            margin-bottom: 5px;
-        }
-        .summary-card p {
-            color: #7f8c8d;
-            font-size: 0.9em;
-        }
-        .section {
-            background: white;
-            padding: 25px;
-            border-radius: 10px;
-            margin-bottom: 30px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-        .section h2 {
-            color: #2c3e50;
-            margin-bottom: 20px;
-            padding-bottom: 10px;
-            border-bottom: 2px solid #667eea;
-        }
-        table {
-            width: 100%;
-            border-collapse: collapse;
-            margin-top: 15px;
-        }
-        th {
-            background: #667eea;
-            color: white;
-            padding: 12px;
-            text-align: left;
-            font-weight: 600;
-        }
-        td {
-            padding: 12px;
-            border-bottom: 1px solid #e0e0e0;
-        }
-        tr:hover { background: #f8f9fa; }
-        .badge {
-            display: inline-block;
-            padding: 5px 10px;
-            border-radius: 20px;
-            font-size: 0.85em;
-            font-weight: 600;
-        }
-        .badge-success { background: #d4edda; color: #155724; }
-        .badge-warning { background: #fff3cd; color: #856404; }
-        .badge-danger { background: #f8d7da; color: #721c24; }
-        .badge-info { background: #d1ecf1; color: #0c5460; }
-        .issue-item {
-            padding: 15px;
-            margin: 10px 0;
-            border-left: 4px solid #667eea;
-            background: #f8f9fa;
-            border-radius: 5px;
-        }
-        .issue-warning { border-left-color: #ffc107; }
-        .issue-danger { border-left-color: #dc3545; }
-        .quality-bar {
-            height: 20px;
-            background: #e0e0e0;
-            border-radius: 10px;
-            overflow: hidden;
-            margin-top: 5px;
-        }
-        .quality-fill {
-            height: 100%;
-            background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-            transition: width 0.3s ease;
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>Data Quality Report</h1>
-            <p><strong>File:</strong> {{ report.file }}</p>
-            <p><strong>Generated:</strong> {{ report.generated_at }}</p>
-        </div>
-
-        <div class="score-card">
-            <h2 style="text-align: center; margin-bottom: 10px;">Overall Quality Score</h2>
-            <div class="score-large">{{ report.overall_quality_score }}/100</div>
-            <div class="quality-bar">
-                <div class="quality-fill" style="width: {{ report.overall_quality_score }}%"></div>
-            </div>
-        </div>
-
-        <div class="summary-grid">
-            <div class="summary-card">
-                <h3>{{ report.total_rows | int }}</h3>
-                <p>Total Rows</p>
-            </div>
-            <div class="summary-card">
-                <h3>{{ report.total_columns | int }}</h3>
-                <p>Total Columns</p>
-            </div>
-            <div class="summary-card">
-                <h3>{{ report.summary.columns_with_nulls }}</h3>
-                <p>Columns with Nulls</p>
-            </div>
-            <div class="summary-card">
-                <h3>{{ report.summary.total_issues }}</h3>
-                <p>Issues Detected</p>
-            </div>
-        </div>
-
-        {% if report.issues %}
-        <div class="section">
-            <h2>Issues Detected</h2>
-            {% for issue in report.issues %}
-            <div class="issue-item issue-{{ issue.severity }}">
-                <strong>{{ issue.type | replace('_', ' ') | title }}</strong><br>
-                {{ issue.message }}
-            </div>
-            {% endfor %}
-        </div>
-        {% endif %}
-
-        <div class="section">
-            <h2>Column Analysis</h2>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Column</th>
-                        <th>Type</th>
-                        <th>Nulls</th>
-                        <th>Nulls %</th>
-                        <th>Unique</th>
-                        <th>Duplicates</th>
-                        <th>Score</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {% for col in report.columns %}
-                    <tr>
-                        <td><strong>{{ col.name }}</strong></td>
-                        <td>{{ col.dtype }}</td>
-                        <td>{{ col.null_count | int }}</td>
-                        <td>{{ col.null_pct }}%</td>
-                        <td>{{ col.unique_count | int }}</td>
-                        <td>{{ col.duplicate_count | int }}</td>
-                        <td>
-                            <span class="badge {% if col.quality_score >= 80 %}badge-success{% elif col.quality_score >= 60 %}badge-warning{% else %}badge-danger{% endif %}">
-                                {{ col.quality_score }}
-                            </span>
-                        </td>
-                    </tr>
-                    {% endfor %}
-                </tbody>
-            </table>
-        </div>
-
-        <div class="section">
-            <h2>Numeric Statistics</h2>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Column</th>
-                        <th>Min</th>
-                        <th>Max</th>
-                        <th>Mean</th>
-                        <th>Median</th>
-                        <th>Std Dev</th>
-                        <th>Outliers</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {% for col in report.columns %}
-                    {% if col.is_numeric %}
-                    <tr>
-                        <td><strong>{{ col.name }}</strong></td>
-                        <td>{{ col.min if col.min is not none else '-' }}</td>
-                        <td>{{ col.max if col.max is not none else '-' }}</td>
-                        <td>{{ col.mean if col.mean is not none else '-' }}</td>
-                        <td>{{ col.median if col.median is not none else '-' }}</td>
-                        <td>{{ col.std if col.std is not none else '-' }}</td>
-                        <td>
-                            {% if col.outliers_count > 0 %}
-                            <span class="badge badge-warning">{{ col.outliers_count }} ({{ col.outliers_pct }}%)</span>
-                            {% else %}
-                            <span class="badge badge-success">0</span>
-                            {% endif %}
-                        </td>
-                    </tr>
-                    {% endif %}
-                    {% endfor %}
-                </tbody>
-            </table>
-        </div>
-    </div>
-</body>
-</html>
-        """
+        # Stream the rendered chunks to disk instead of building the whole page in memory
+        with output_path.open('w', encoding='utf-8') as f:
+            HTML_TEMPLATE.stream(report=self.quality_report).dump(f)
+        console.print(f"[green]HTML report generated:[/green] {output_path}")
 
-        template = Template(html_template)
-        html_content = template.render(report=self.quality_report)
 
-        output_path.write_text(html_content, encoding='utf-8')
-        console.print(f"[green]HTML report generated:[/green] {output_path}")
+def cached_report(profiler: DataQualityProfiler, chunksize: Optional[int] = None) -> Dict:
+    """Generate the report, reusing a cached copy while the file is unchanged
+
+    The cache key covers the file's path, mtime and size plus this script's
+    own mtime, so changing either one invalidates it.
+    """
+    stat = profiler.filepath.stat()
+    key = ":".join(map(str, (
+        profiler.filepath.resolve(), stat.st_mtime_ns, stat.st_size, chunksize,
+        Path(__file__).stat().st_mtime_ns,
+    )))
+    cache_file = REPORT_CACHE_DIR / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    if cache_file.exists():
+        profiler.quality_report = json.loads(cache_file.read_text(encoding='utf-8'))
+        return profiler.quality_report
+
+    if chunksize:
+        report = profiler.stream_report(chunksize)
+    else:
+        profiler.load_data()
+        report = profiler.generate_report()
+
+    try:
+        REPORT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write then rename so a concurrent run never reads a partial file
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_text(json.dumps(report, default=str), encoding='utf-8')
+        tmp_file.replace(cache_file)
+    except OSError:
+        pass  # Caching is best effort
+
+    return report
 
 
 def render_console_report(report: Dict) -> None:
@@ -500,14 +585,23 @@ def main(
     filepath: Path = typer.Argument(..., help="Path to data file (CSV, Parquet, JSON)"),
     output: Optional[Path] = typer.Option(None, "--output", "-o", help="Path to save HTML report"),
     json_output: Optional[Path] = typer.Option(None, "--json", help="Export report as JSON"),
+    chunksize: Optional[int] = typer.Option(
+        None, "--chunksize", help="Stream a CSV in chunks of this many rows instead of loading it whole"
+    ),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Re-analyze even if the file is unchanged"),
 ):
     """
     Analyze data quality and generate reports
     """
     try:
         profiler = DataQualityProfiler(filepath)
-        profiler.load_data()
-        report = profiler.generate_report()
+        if not no_cache:
+            report = cached_report(profiler, chunksize)
+        elif chunksize:
+            report = profiler.stream_report(chunksize)
+        else:
+            profiler.load_data()
+            report = profiler.generate_report()
 
         # Render in console
         render_console_report(report)
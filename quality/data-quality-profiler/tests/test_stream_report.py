@@ -0,0 +1,61 @@
+"""Streaming profiles must agree with profiling the whole file at once.
+
+Small chunk sizes force a column's values across several chunks, where the
+parser would otherwise guess a different type for each one.
+"""
+
+import pandas as pd
+
+from data_quality_profiler import DataQualityProfiler
+
+
+def write_csv(tmp_path, **columns):
+    path = tmp_path / "data.csv"
+    pd.DataFrame(columns).to_csv(path, index=False)
+    return path
+
+
+def column(report, name):
+    return next(c for c in report["columns"] if c["name"] == name)
+
+
+def test_mixed_type_column_counts_each_value_once(tmp_path):
+    path = write_csv(tmp_path, code=["1", "2", "1", "2", "1", "2", "1", "2", "A1", "2"])
+
+    code = column(DataQualityProfiler(path).stream_report(chunksize=4), "code")
+
+    assert code["dtype"] == "object"
+    assert code["unique_count"] == 3
+    assert not code["is_numeric"]
+
+
+def test_mixed_type_column_samples_early_chunks_for_formats(tmp_path):
+    # Half emails is not a majority once the leading numbers are sampled too
+    emails = [f"user{i}@example.com" for i in range(4)]
+    path = write_csv(tmp_path, contact=["1", "2", "3", "4"] + emails)
+
+    contact = column(DataQualityProfiler(path).stream_report(chunksize=4), "contact")
+
+    assert contact["unique_count"] == 8
+    assert not contact.get("likely_email")
+
+
+def test_bool_column_with_nulls_matches_full_read(tmp_path):
+    path = write_csv(tmp_path, flag=[True, False, True, None, True, False, True, False])
+
+    flag = column(DataQualityProfiler(path).stream_report(chunksize=3), "flag")
+    full = pd.read_csv(path)["flag"]
+
+    assert flag["dtype"] == str(full.dtype)
+    assert flag["unique_count"] == full.nunique()
+    assert flag["null_count"] == 1
+
+
+def test_int_column_with_nulls_in_later_chunk(tmp_path):
+    path = write_csv(tmp_path, n=[1, 2, 3, 4, None, 2, 3, 5])
+
+    n = column(DataQualityProfiler(path).stream_report(chunksize=4), "n")
+
+    assert n["dtype"] == "float64"
+    assert n["unique_count"] == 5
+    assert n["mean"] == 2.86
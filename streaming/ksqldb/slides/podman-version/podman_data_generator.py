@@ -4,13 +4,15 @@ Data Generator for ksqlDB Demo with Podman
 Simulates real-time e-commerce transactions
 """
 
-import json
-import random
 import time
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field
+import argparse
 import threading
+import queue
 import sys
+import numpy as np
+import orjson
 from kafka import KafkaProducer
 
 @dataclass
@@ -29,9 +31,30 @@ class Transaction:
     ip_address: str
     suspicious: bool
     alert_message: str = ""
+    # Kafka message key, encoded once when the transaction is created
+    key: bytes = field(default=b"", repr=False)
+    
+    def to_dict(self) -> dict:
+        """Flat dict for serialization (avoids asdict's recursive deep copy)"""
+        return {
+            "transaction_id": self.transaction_id,
+            "user_id": self.user_id,
+            "product_name": self.product_name,
+            "category": self.category,
+            "amount": self.amount,
+            "timestamp": self.timestamp,
+            "payment_method": self.payment_method,
+            "state": self.state,
+            "city": self.city,
+            "device_type": self.device_type,
+            "ip_address": self.ip_address,
+            "suspicious": self.suspicious,
+            "alert_message": self.alert_message
+        }
 
 class TransactionGenerator:
-    def __init__(self):
+    def __init__(self, linger_ms: int = 50, batch_size: int = 64_000,
+                 compression_type: str = "gzip", buffer_memory: int = 64 * 1024 * 1024):
         # Sample data for generating realistic transactions
         self.products = [
             ("iPhone 15 Pro", "Electronics"), ("Samsung Galaxy S24", "Electronics"),
@@ -42,6 +65,23 @@ class TransactionGenerator:
             ("Python Book", "Books"), ("AI Book", "Books"),
             ("Premium Coffee", "Food"), ("Acai Bowl", "Food")
         ]
+        # Parallel name/category columns so a product is picked with one index draw
+        self.product_names = tuple(name for name, _ in self.products)
+        self.product_categories = tuple(category for _, category in self.products)
+        
+        # Amount range per category, with a default for everything else
+        self.category_amount_ranges = {
+            "Electronics": (800, 8000),
+            "Fashion": (50, 500),
+            "Health": (30, 300)
+        }
+        self.default_amount_range = (20, 200)
+        # Per-product (low, high) amount bounds for the vectorized batch path
+        self.product_amount_ranges = np.array([
+            self.category_amount_ranges.get(category, self.default_amount_range)
+            for category in self.product_categories
+        ], dtype=float)
+        self.rng = np.random.default_rng()
         
         self.payment_methods = ["credit_card", "debit_card", "pix", "paypal", "crypto"]
         
@@ -54,168 +94,189 @@ class TransactionGenerator:
         self.device_types = ["mobile", "desktop", "tablet"]
         
         # Fraud detection configurations
-        self.high_risk_ips = ["192.168.100.666", "10.0.0.999", "172.16.255.255"]
+        self.high_risk_ips = ("192.168.100.666", "10.0.0.999", "172.16.255.255")
         self.suspicious_amounts = [(5000, 10000), (15000, 25000)]
         
+        # Generated transactions are handed to a sender thread through this
+        # queue; None is the shutdown sentinel
+        self.send_queue = queue.Queue(maxsize=10_000)
+        
         # Setup Kafka producer
-        self.setup_kafka_producer()
+        self.setup_kafka_producer(linger_ms, batch_size, compression_type, buffer_memory)
     
-    def setup_kafka_producer(self):
+    def setup_kafka_producer(self, linger_ms: int, batch_size: int,
+                             compression_type: str, buffer_memory: int):
         """Configure Kafka producer"""
         try:
             self.producer = KafkaProducer(
                 bootstrap_servers=['localhost:9092'],
-                value_serializer=lambda x: json.dumps(x, ensure_ascii=False).encode('utf-8'),
-                key_serializer=lambda x: x.encode('utf-8') if x else None
+                value_serializer=orjson.dumps,
+                # Let sends accumulate into batches instead of one request per message
+                linger_ms=linger_ms,
+                batch_size=batch_size,
+                compression_type=None if compression_type == "none" else compression_type,
+                buffer_memory=buffer_memory,
+                acks=1
             )
             print("Connected to Kafka (Podman)")
         except Exception as e:
             print(f"Error connecting to Kafka: {e}")
             sys.exit(1)
     
-    def generate_ip(self, suspicious: bool = False) -> str:
-        """Generate IP address (suspicious or normal)"""
-        if suspicious and random.random() < 0.3:
-            return random.choice(self.high_risk_ips)
-        
-        return f"{random.randint(1,255)}.{random.randint(1,255)}.{random.randint(1,255)}.{random.randint(1,255)}"
+    @staticmethod
+    def format_ip(packed: int) -> str:
+        """Format a packed 32-bit address as a dotted quad"""
+        return f"{(packed >> 24) & 0xff}.{(packed >> 16) & 0xff}.{(packed >> 8) & 0xff}.{packed & 0xff}"
     
-    def detect_fraud(self, transaction: Transaction) -> bool:
-        """Simple fraud detection algorithm"""
-        fraud_indicators = 0
+    def generate_batch(self, n: int) -> list:
+        """Generate n transactions from vectorized random draws"""
+        rng = self.rng
         
-        # Very high amount
-        if transaction.amount > 5000:
-            fraud_indicators += 1
+        transaction_ids = rng.integers(100000, 999999, n, endpoint=True)
+        user_ids = rng.integers(1000, 9999, n, endpoint=True)
+        product_idx = rng.integers(0, len(self.product_names), n)
+        payment_idx = rng.integers(0, len(self.payment_methods), n)
+        state_idx = rng.integers(0, len(self.us_states), n)
+        device_idx = rng.integers(0, len(self.device_types), n)
         
-        # Suspicious IP
-        if transaction.ip_address in self.high_risk_ips:
-            fraud_indicators += 2
-            
-        # Payment method + suspicious time
-        if transaction.payment_method == "crypto" and datetime.now().hour < 6:
-            fraud_indicators += 1
-            
-        # Multiple risk factors
-        if (transaction.amount > 2000 and 
-            transaction.device_type == "mobile" and 
-            transaction.payment_method in ["crypto", "paypal"]):
-            fraud_indicators += 1
-        
-        return fraud_indicators >= 2
-    
-    def generate_transaction(self) -> Transaction:
-        """Generate a single transaction"""
-        # Basic data
-        transaction_id = f"TXN{random.randint(100000, 999999)}"
-        user_id = f"USER{random.randint(1000, 9999)}"
-        product_name, category = random.choice(self.products)
+        # Amount based on category, occasionally replaced by a suspicious amount
+        bounds = self.product_amount_ranges[product_idx]
+        amounts = np.round(rng.uniform(bounds[:, 0], bounds[:, 1]), 2)
+        amounts = np.where(rng.random(n) < 0.15,  # 15% chance
+                           np.round(rng.uniform(5000, 20000, n), 2), amounts)
         
-        # Amount based on category
-        if category == "Electronics":
-            amount = round(random.uniform(800, 8000), 2)
-        elif category == "Fashion":
-            amount = round(random.uniform(50, 500), 2)
-        elif category == "Health":
-            amount = round(random.uniform(30, 300), 2)
-        else:
-            amount = round(random.uniform(20, 200), 2)
+        # Fraud rules: two or more indicators flag a transaction. IPs are
+        # assigned after detection, so they are not an indicator.
+        now = datetime.now()
+        is_crypto = payment_idx == self.payment_methods.index("crypto")
+        is_paypal = payment_idx == self.payment_methods.index("paypal")
+        is_mobile = device_idx == self.device_types.index("mobile")
+        fraud_indicators = (amounts > 5000).astype(int)
+        if now.hour < 6:
+            fraud_indicators += is_crypto
+        fraud_indicators += (amounts > 2000) & is_mobile & (is_crypto | is_paypal)
+        suspicious = fraud_indicators >= 2
         
-        # Occasionally generate suspicious amounts
-        if random.random() < 0.15:  # 15% chance
-            amount = round(random.uniform(5000, 20000), 2)
+        # Suspicious transactions sometimes come from a known high-risk IP
+        use_high_risk_ip = suspicious & (rng.random(n) < 0.3)
+        high_risk_idx = rng.integers(0, len(self.high_risk_ips), n)
+        packed_ips = rng.integers(0, 2**32, n, dtype=np.uint32)
         
-        # Other fields
-        timestamp = datetime.now().isoformat()
-        payment_method = random.choice(self.payment_methods)
-        state_code, city = random.choice(self.us_states)
-        device_type = random.choice(self.device_types)
+        timestamp = now.isoformat(timespec='milliseconds')
+        transactions = []
+        for (txn, user, product_i, amount, payment_i, state_i, device_i, is_suspicious,
+             high_risk, high_risk_i, packed_ip) in zip(
+                transaction_ids.tolist(), user_ids.tolist(), product_idx.tolist(),
+                amounts.tolist(), payment_idx.tolist(), state_idx.tolist(),
+                device_idx.tolist(), suspicious.tolist(), use_high_risk_ip.tolist(),
+                high_risk_idx.tolist(), packed_ips.tolist()):
+            state_code, city = self.us_states[state_i]
+            ip_address = (self.high_risk_ips[high_risk_i] if high_risk
+                          else self.format_ip(packed_ip))
+            transactions.append(Transaction(
+                transaction_id=f"TXN{txn}",
+                user_id=f"USER{user}",
+                product_name=self.product_names[product_i],
+                category=self.product_categories[product_i],
+                amount=amount,
+                timestamp=timestamp,
+                payment_method=self.payment_methods[payment_i],
+                state=state_code,
+                city=city,
+                device_type=self.device_types[device_i],
+                ip_address=ip_address,
+                suspicious=is_suspicious,
+                alert_message=(f"FRAUD DETECTED! Amount: ${amount:.2f}, IP: {ip_address}"
+                               if is_suspicious else ""),
+                key=b"TXN%d" % txn
+            ))
         
-        # Create initial transaction
-        transaction = Transaction(
-            transaction_id=transaction_id,
-            user_id=user_id,
-            product_name=product_name,
-            category=category,
-            amount=amount,
-            timestamp=timestamp,
-            payment_method=payment_method,
-            state=state_code,
-            city=city,
-            device_type=device_type,
-            ip_address="",  # Will be filled below
-            suspicious=False  # Will be calculated below
-        )
-        
-        # Detect fraud
-        transaction.suspicious = self.detect_fraud(transaction)
-        transaction.ip_address = self.generate_ip(transaction.suspicious)
-        
-        # Add alert message if suspicious
-        if transaction.suspicious:
-            transaction.alert_message = f"FRAUD DETECTED! Amount: ${amount:.2f}, IP: {transaction.ip_address}"
-        
-        return transaction
+        return transactions
     
     def send_transaction(self, transaction: Transaction):
-        """Send transaction to Kafka"""
+        """Send transaction to Kafka without waiting for the broker"""
         try:
             # Convert to dict
-            transaction_dict = asdict(transaction)
+            transaction_dict = transaction.to_dict()
             
-            # Send to Kafka
-            future = self.producer.send(
+            # Send to Kafka; delivery is reported asynchronously by the callbacks
+            self.producer.send(
                 'ecommerce_transactions',
-                key=transaction.transaction_id,
+                key=transaction.key,
                 value=transaction_dict
-            )
-            
-            # Wait for confirmation
-            future.get(timeout=10)
-            
-            # Log transaction
-            fraud_indicator = "SUSPICIOUS" if transaction.suspicious else "Normal"
-            print(f"{fraud_indicator} | {transaction.transaction_id} | {transaction.user_id} | "
-                  f"{transaction.product_name} | ${transaction.amount:.2f} | {transaction.state}")
-            
-            if transaction.suspicious:
-                print(f"    └─ {transaction.alert_message}")
+            ).add_callback(self._on_delivery, transaction).add_errback(self._on_send_error, transaction)
             
         except Exception as e:
             print(f"Error sending transaction: {e}")
     
-    def run_generator(self, duration_minutes: int = 10, transactions_per_minute: int = 12):
+    def _send_loop(self):
+        """Drain the send queue until the shutdown sentinel arrives"""
+        while True:
+            transaction = self.send_queue.get()
+            if transaction is None:
+                break
+            self.send_transaction(transaction)
+    
+    def _on_delivery(self, transaction: Transaction, record_metadata):
+        """Log a transaction once the broker has acknowledged it"""
+        fraud_indicator = "SUSPICIOUS" if transaction.suspicious else "Normal"
+        print(f"{fraud_indicator} | {transaction.transaction_id} | {transaction.user_id} | "
+              f"{transaction.product_name} | ${transaction.amount:.2f} | {transaction.state}")
+        
+        if transaction.suspicious:
+            print(f"    └─ {transaction.alert_message}")
+    
+    def _on_send_error(self, transaction: Transaction, exc):
+        """Report a transaction the producer failed to deliver"""
+        print(f"Error sending transaction {transaction.transaction_id}: {exc}")
+    
+    def run_generator(self, duration_minutes: int = 10, transactions_per_minute: int = 12,
+                      pace: bool = True):
         """Run generator for a specific period"""
         print(f"STARTING DATA GENERATOR - PODMAN VERSION")
         print(f"Duration: {duration_minutes} minutes")
-        print(f"Rate: {transactions_per_minute} transactions/minute")
+        print(f"Rate: {transactions_per_minute} transactions/minute" if pace
+              else "Rate: unpaced (producer batching only)")
         print(f"Kafka Topic: ecommerce_transactions")
         print("=" * 60)
         
-        interval = 60 / transactions_per_minute  # Interval in seconds
+        # Generate about one second's worth of transactions per batch
+        batch_size = max(1, round(transactions_per_minute / 60))
+        interval = batch_size * 60 / transactions_per_minute  # Interval in seconds
         end_time = datetime.now() + timedelta(minutes=duration_minutes)
+        # Deadline pacing: batches are scheduled on the monotonic clock, so send
+        # time does not accumulate on top of the interval
+        next_tick = time.monotonic()
         
         transaction_count = 0
         suspicious_count = 0
         
+        # Kafka sends run on their own thread so generation never waits on I/O
+        sender = threading.Thread(target=self._send_loop, name="kafka-sender", daemon=True)
+        sender.start()
+        
         try:
             while datetime.now() < end_time:
-                # Generate and send transaction
-                transaction = self.generate_transaction()
-                self.send_transaction(transaction)
-                
-                transaction_count += 1
-                if transaction.suspicious:
-                    suspicious_count += 1
+                # Generate a batch of transactions and queue them for sending
+                for transaction in self.generate_batch(batch_size):
+                    self.send_queue.put(transaction)
+                    
+                    transaction_count += 1
+                    if transaction.suspicious:
+                        suspicious_count += 1
+                    
+                    # Statistics every 50 transactions
+                    if transaction_count % 50 == 0:
+                        fraud_rate = (suspicious_count / transaction_count) * 100
+                        print(f"\nSTATISTICS: {transaction_count} transactions | "
+                              f"{suspicious_count} suspicious ({fraud_rate:.1f}%)\n")
                 
-                # Statistics every 50 transactions
-                if transaction_count % 50 == 0:
-                    fraud_rate = (suspicious_count / transaction_count) * 100
-                    print(f"\nSTATISTICS: {transaction_count} transactions | "
-                          f"{suspicious_count} suspicious ({fraud_rate:.1f}%)\n")
-                
-                # Wait for next transaction
-                time.sleep(interval)
+                # Wait for next batch
+                if pace:
+                    next_tick += interval
+                    sleep_for = next_tick - time.monotonic()
+                    if sleep_for > 0:
+                        time.sleep(sleep_for)
                 
         except KeyboardInterrupt:
             print(f"\nGenerator interrupted by user")
@@ -229,26 +290,42 @@ class TransactionGenerator:
             print(f"   • Fraud rate: {fraud_rate:.1f}%")
             print(f"   • Actual duration: {datetime.now().strftime('%H:%M:%S')}")
             
+            # Let the sender drain the queue, then deliver anything still buffered
+            self.send_queue.put(None)
+            sender.join()
+            self.producer.flush()
             self.producer.close()
             print("Generator finished - Podman version")
 
 def main():
     """Main function"""
-    if len(sys.argv) < 2:
-        print("Usage: python3 podman_data_generator.py <minutes> [transactions_per_minute]")
-        print("Example: python3 podman_data_generator.py 5 15")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Generate e-commerce transactions for the ksqlDB demo",
+        epilog="Example: python3 podman_data_generator.py 5 15"
+    )
+    parser.add_argument("minutes", type=int, help="How long to generate for")
+    parser.add_argument("transactions_per_minute", type=int, nargs="?", default=12,
+                        help="Target rate (default: 12)")
+    parser.add_argument("--no-pace", action="store_true",
+                        help="Don't sleep between batches; let producer batching set the pace")
+    parser.add_argument("--linger-ms", type=int, default=50,
+                        help="Producer linger.ms (default: 50)")
+    parser.add_argument("--batch-size", type=int, default=64_000,
+                        help="Producer batch.size in bytes (default: 64000)")
+    parser.add_argument("--compression", default="gzip",
+                        choices=["none", "gzip", "snappy", "lz4", "zstd"],
+                        help="Producer compression codec (default: gzip; "
+                             "snappy/lz4/zstd need their codec libraries)")
+    args = parser.parse_args()
     
     try:
-        duration = int(sys.argv[1])
-        rate = int(sys.argv[2]) if len(sys.argv) > 2 else 12
-        
-        generator = TransactionGenerator()
-        generator.run_generator(duration, rate)
+        generator = TransactionGenerator(
+            linger_ms=args.linger_ms,
+            batch_size=args.batch_size,
+            compression_type=args.compression
+        )
+        generator.run_generator(args.minutes, args.transactions_per_minute, not args.no_pace)
         
-    except ValueError:
-        print("ERROR: Arguments must be integers")
-        sys.exit(1)
     except Exception as e:
         print(f"ERROR: {e}")
         sys.exit(1)